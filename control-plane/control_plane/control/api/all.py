@@ -5,6 +5,7 @@ from control_plane.control.api.registration import RegistrationApiHandler
 from control_plane.control.api.repository_credentials import (
     ContainerRepositoryCredentialsApiHandler,
 )
+from control_plane.control.api.utils.latest_version_cache import LatestVersionCache
 from control_plane.data.data_store import DataStore
 from control_plane.docker.credentials_loader import (
     AbstractContainerRepositoryCredentialsLoader,
@@ -19,10 +20,12 @@ class ApiHandler:
         provisioner: AbstractProvisioner,
         credentials_loader: AbstractContainerRepositoryCredentialsLoader,
     ) -> None:
-        self._registration = RegistrationApiHandler(data_store)
-        self._invocation = InvocationApiHandler(data_store)
-        self._execution = ExecutionApiHandler(data_store)
-        self._logs = LogsApiHandler(data_store, provisioner)
+        latest_version_cache = LatestVersionCache()
+
+        self._registration = RegistrationApiHandler(data_store, latest_version_cache)
+        self._invocation = InvocationApiHandler(data_store, latest_version_cache)
+        self._execution = ExecutionApiHandler(data_store, latest_version_cache)
+        self._logs = LogsApiHandler(data_store, provisioner, latest_version_cache)
         self._repository_credentials = ContainerRepositoryCredentialsApiHandler(
             credentials_loader
         )
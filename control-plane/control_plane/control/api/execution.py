@@ -1,5 +1,6 @@
 import logging
 
+from control_plane.control.api.utils.latest_version_cache import LatestVersionCache
 from control_plane.control.api.utils.version_reference_resolution import (
     resolve_version_reference,
 )
@@ -20,8 +21,9 @@ class ExecutionApiHandler:
     Called by a worker.
     """
 
-    def __init__(self, data_store: DataStore):
+    def __init__(self, data_store: DataStore, latest_version_cache: LatestVersionCache):
         self._data_store = data_store
+        self._latest_version_cache = latest_version_cache
 
     def get_execution(
         self,
@@ -40,7 +42,7 @@ class ExecutionApiHandler:
         :raises ExecutionDoesNotExist:
         """
         version_id = resolve_version_reference(
-            project_name, version_ref, self._data_store
+            project_name, version_ref, self._data_store, self._latest_version_cache
         )
 
         return self._data_store.executions.get(
@@ -71,7 +73,7 @@ class ExecutionApiHandler:
         :raises ExecutionIsAlreadyTerminated:
         """
         version_id = resolve_version_reference(
-            project_name, version_ref, self._data_store
+            project_name, version_ref, self._data_store, self._latest_version_cache
         )
 
         self._data_store.executions.update(
@@ -121,7 +123,7 @@ class ExecutionApiHandler:
         :raises ExecutionIsAlreadyTerminated:
         """
         version_id = resolve_version_reference(
-            project_name, version_ref, self._data_store
+            project_name, version_ref, self._data_store, self._latest_version_cache
         )
 
         self._data_store.executions.update(
@@ -172,7 +174,7 @@ class ExecutionApiHandler:
         :raises ExecutionIsAlreadyTerminated:
         """
         version_id = resolve_version_reference(
-            project_name, version_ref, self._data_store
+            project_name, version_ref, self._data_store, self._latest_version_cache
         )
 
         self._data_store.executions.update(
@@ -1,6 +1,7 @@
 import logging
 from typing import Optional
 
+from control_plane.control.api.utils.latest_version_cache import LatestVersionCache
 from control_plane.control.api.utils.version_reference_resolution import (
     resolve_version_reference,
 )
@@ -26,8 +27,11 @@ class InvocationApiHandler:
         an existing function invocation
     """
 
-    def __init__(self, data_store: DataStore) -> None:
+    def __init__(
+        self, data_store: DataStore, latest_version_cache: LatestVersionCache
+    ) -> None:
         self._data_store = data_store
+        self._latest_version_cache = latest_version_cache
 
     def create_invocation(
         self,
@@ -45,7 +49,7 @@ class InvocationApiHandler:
         :raises ParentInvocationDoesNotExist:
         """
         version_id = resolve_version_reference(
-            project_name, version_ref, self._data_store
+            project_name, version_ref, self._data_store, self._latest_version_cache
         )
 
         invocation_id = generate_random_id("inv")
@@ -92,7 +96,7 @@ class InvocationApiHandler:
         :raises InvocationIsAlreadyTerminated:
         """
         version_id = resolve_version_reference(
-            project_name, version_ref, self._data_store
+            project_name, version_ref, self._data_store, self._latest_version_cache
         )
 
         self._data_store.invocations.update(
@@ -132,7 +136,7 @@ class InvocationApiHandler:
         :raises InvocationDoesNotExist:
         """
         version_id = resolve_version_reference(
-            project_name, version_ref, self._data_store
+            project_name, version_ref, self._data_store, self._latest_version_cache
         )
 
         return self._data_store.invocations.get(
@@ -160,7 +164,7 @@ class InvocationApiHandler:
         :raises OffsetIsInvalid:
         """
         version_id = resolve_version_reference(
-            project_name, version_ref, self._data_store
+            project_name, version_ref, self._data_store, self._latest_version_cache
         )
 
         if max_results is None or max_results >= 50:
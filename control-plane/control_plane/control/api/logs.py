@@ -1,5 +1,6 @@
 from typing import Optional
 
+from control_plane.control.api.utils.latest_version_cache import LatestVersionCache
 from control_plane.control.api.utils.version_reference_resolution import (
     resolve_version_reference,
 )
@@ -14,8 +15,14 @@ class LogsApiHandler:
     API method for getting logs generated by an execution.
     """
 
-    def __init__(self, data_store: DataStore, provisioner: AbstractProvisioner) -> None:
+    def __init__(
+        self,
+        data_store: DataStore,
+        provisioner: AbstractProvisioner,
+        latest_version_cache: LatestVersionCache,
+    ) -> None:
         self._data_store = data_store
+        self._latest_version_cache = latest_version_cache
         self._provisioner = provisioner
 
     def get_execution_logs(
@@ -37,7 +44,7 @@ class LogsApiHandler:
         :raises ExecutionDoesNotExist:
         """
         version_id = resolve_version_reference(
-            project_name, version_ref, self._data_store
+            project_name, version_ref, self._data_store, self._latest_version_cache
         )
 
         if max_lines is not None:
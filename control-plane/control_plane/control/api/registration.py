@@ -1,5 +1,6 @@
 import logging
 
+from control_plane.control.api.utils.latest_version_cache import LatestVersionCache
 from control_plane.control.api.utils.project_deletion_requests import (
     check_project_is_not_being_deleted,
 )
@@ -25,8 +26,11 @@ class RegistrationApiHandler:
     Called by the CLI tool.
     """
 
-    def __init__(self, data_store: DataStore) -> None:
+    def __init__(
+        self, data_store: DataStore, latest_version_cache: LatestVersionCache
+    ) -> None:
         self._data_store = data_store
+        self._latest_version_cache = latest_version_cache
 
     def create_project(self, *, project_name: str, time: int) -> ProjectInfo:
         """
@@ -37,6 +41,9 @@ class RegistrationApiHandler:
         )
         logging.info(f"Created project ({project_name}).")
 
+        # A project with the same name may have been deleted, so drop any version id cached for it
+        self._latest_version_cache.invalidate(project_name)
+
         return self._data_store.projects.get(project_name=project_name)
 
     def delete_project(self, *, project_name: str, time: int) -> ProjectInfo:
@@ -50,6 +57,8 @@ class RegistrationApiHandler:
             f"Updated project ({project_name})." f" - set deletion requested flag"
         )
 
+        self._latest_version_cache.invalidate(project_name)
+
         return self._data_store.projects.get(project_name=project_name)
 
     def get_project(self, *, project_name: str) -> ProjectInfo:
@@ -98,6 +107,8 @@ class RegistrationApiHandler:
                 f" - status = {FunctionStatus.PENDING}"
             )
 
+        self._latest_version_cache.invalidate(project_name)
+
         return self._data_store.project_versions.get(
             project_name=project_name, version_id=version_id
         )
@@ -110,7 +121,7 @@ class RegistrationApiHandler:
         :raises VersionDoesNotExist:
         """
         version_id = resolve_version_reference(
-            project_name, version_ref, self._data_store
+            project_name, version_ref, self._data_store, self._latest_version_cache
         )
 
         return self._data_store.project_versions.get(
@@ -0,0 +1,62 @@
+import threading
+import time
+from typing import Optional
+
+DEFAULT_TTL_SECONDS = 2.0
+
+
+class LatestVersionCache:
+    """
+    Short-lived, in-process cache of the id of the latest version of each project.
+
+    Resolving the "latest" version reference otherwise costs a database query on every request.
+    Entries are dropped when a project or a version is created or deleted through this process, so reads made
+    through the same process always see its own writes. Versions created through other API processes become
+    visible once the cached entry expires, so the TTL bounds the staleness across processes.
+
+    API handlers run on a thread pool, so a lookup can race with an invalidation. To stop a lookup that read
+    the database before the invalidation from caching the old id afterwards, each project has a generation
+    that invalidate() bumps. Callers read the generation before querying the database, and put() discards the
+    result if the generation has changed since.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[str, float]] = {}
+        self._generations: dict[str, int] = {}
+
+    def get(self, project_name: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(project_name)
+            if entry is None:
+                return None
+
+            version_id, expiry_time = entry
+            if time.monotonic() >= expiry_time:
+                self._entries.pop(project_name, None)
+                return None
+
+            return version_id
+
+    def generation(self, project_name: str) -> int:
+        with self._lock:
+            return self._generations.get(project_name, 0)
+
+    def put(self, project_name: str, version_id: str, generation: int) -> None:
+        """
+        :param generation: the project's generation, read before the version id was loaded from the database
+        """
+        with self._lock:
+            if self._generations.get(project_name, 0) != generation:
+                # Invalidated since the version id was loaded, so it may be out of date
+                return
+            self._entries[project_name] = (
+                version_id,
+                time.monotonic() + self._ttl_seconds,
+            )
+
+    def invalidate(self, project_name: str) -> None:
+        with self._lock:
+            self._entries.pop(project_name, None)
+            self._generations[project_name] = self._generations.get(project_name, 0) + 1
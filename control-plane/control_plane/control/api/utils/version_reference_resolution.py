@@ -1,16 +1,25 @@
+from control_plane.control.api.utils.latest_version_cache import LatestVersionCache
 from control_plane.data.data_store import DataStore
 from control_plane.types.version_reference import VersionReference, VersionReferenceType
 
 
 def resolve_version_reference(
-    project_name: str, version_ref: VersionReference, data_store: DataStore
+    project_name: str,
+    version_ref: VersionReference,
+    data_store: DataStore,
+    latest_version_cache: LatestVersionCache,
 ) -> str:
     if version_ref.type == VersionReferenceType.NAMED:
         assert version_ref.named_version_id is not None
         return version_ref.named_version_id
     elif version_ref.type == VersionReferenceType.LATEST:
-        return data_store.project_versions.get_id_of_latest_version(
-            project_name=project_name
-        )
+        version_id = latest_version_cache.get(project_name)
+        if version_id is None:
+            generation = latest_version_cache.generation(project_name)
+            version_id = data_store.project_versions.get_id_of_latest_version(
+                project_name=project_name
+            )
+            latest_version_cache.put(project_name, version_id, generation)
+        return version_id
     else:
         raise ValueError
@@ -1,18 +1,18 @@
 from typing import NamedTuple
 
-from control_plane.types.datatypes import ExecutionInfo
+from control_plane.types.datatypes import ExecutionHeader
 
 
 class RunningExecutionsClassification(NamedTuple):
-    executions_requiring_termination_signal: list[ExecutionInfo]
-    executions_to_leave_untouched: list[ExecutionInfo]
+    executions_requiring_termination_signal: list[ExecutionHeader]
+    executions_to_leave_untouched: list[ExecutionHeader]
 
 
 def classify_running_executions_for_termination_signals(
-    running_executions: list[ExecutionInfo], time: int
+    running_executions: list[ExecutionHeader], time: int
 ) -> RunningExecutionsClassification:
-    executions_requiring_termination_signal: list[ExecutionInfo] = []
-    executions_to_leave_untouched: list[ExecutionInfo] = []
+    executions_requiring_termination_signal: list[ExecutionHeader] = []
+    executions_to_leave_untouched: list[ExecutionHeader] = []
 
     for execution in running_executions:
         if execution.termination_signal_sent:
@@ -31,7 +31,7 @@ def classify_running_executions_for_termination_signals(
     )
 
 
-def _has_timed_out(execution: ExecutionInfo, time: int) -> bool:
+def _has_timed_out(execution: ExecutionHeader, time: int) -> bool:
     timeout_seconds = execution.execution_spec.timeout_seconds
     time_elapsed = time - execution.invocation_creation_time
     return time_elapsed > timeout_seconds
@@ -2,12 +2,18 @@ import logging
 
 from control_plane.control.periodic.invocations_cancellation_requests_helper import (
     classify_invocations_for_cancellation_requests,
+    construct_identifier,
 )
 from control_plane.control.periodic.invocations_helper import (
     classify_running_invocations,
 )
 from control_plane.data.data_store import DataStore
-from control_plane.types.datatypes import FunctionStatus, InvocationStatus, WorkerStatus
+from control_plane.types.datatypes import (
+    FunctionStatus,
+    InvocationInfo,
+    InvocationStatus,
+    WorkerStatus,
+)
 from control_plane.types.random_ids import generate_random_id
 
 
@@ -21,16 +27,24 @@ class InvocationsLifecycleActions:
         self._data_store = data_store
 
     def run_all(self, time: int) -> None:
+        # Both actions work on the invocations in RUNNING status, so load them from the DB only once.
+        running_invocations = self._data_store.invocations.list_all(
+            statuses={InvocationStatus.RUNNING}
+        )
+
         # Any ordering will work. However, this choice of ordering should slightly improve user experience,
         # since it reduces the chance of an execution being created for a child invocation
         # when its parent has already been cancelled.
-
-        self.handle_running_invocations_requiring_cancellation_requests(time)
-        self.handle_running_invocations(time)
+        running_invocations = (
+            self.handle_running_invocations_requiring_cancellation_requests(
+                running_invocations, time
+            )
+        )
+        self.handle_running_invocations(running_invocations, time)
 
     def handle_running_invocations_requiring_cancellation_requests(
-        self, time: int
-    ) -> None:
+        self, running_invocations: list[InvocationInfo], time: int
+    ) -> list[InvocationInfo]:
         """
         If an invocation:
           - is in RUNNING status
@@ -43,14 +57,14 @@ class InvocationsLifecycleActions:
           - does not have cancellation_requested = True
           - belongs to a project with deletion_requested = True
         then we should set cancellation_requested = True on this invocation
-        """
-        # It's more efficient to iterate over the possible children, rather than iterating over the possible parents.
-        # This is because the possible children have status = RUNNING, so there shouldn't be too many
-        # to load from the DB.
-        running_invocations = self._data_store.invocations.list_all(
-            statuses={InvocationStatus.RUNNING}
-        )
 
+        It's more efficient to iterate over the possible children, rather than iterating over the possible parents.
+        This is because the possible children have status = RUNNING, so there shouldn't be too many of them.
+
+        :param running_invocations: the invocations in RUNNING status
+        :param time: the current time
+        :return: the same invocations, with the cancellation requests set by this action applied
+        """
         projects = self._data_store.projects.list().projects
 
         classification = classify_invocations_for_cancellation_requests(
@@ -73,7 +87,30 @@ class InvocationsLifecycleActions:
                 f" - set cancellation request flag"
             )
 
-    def handle_running_invocations(self, time: int) -> None:
+        identifiers_of_invocations_cancelled_in_this_pass = {
+            construct_identifier(invocation)
+            for invocation in classification.invocations_to_set_cancellation_requested
+        }
+
+        # Keep the original order, since handle_running_invocations allocates function capacity in list order
+        return [
+            (
+                invocation.model_copy(
+                    update={
+                        "cancellation_request_time": time,
+                        "last_update_time": time,
+                    }
+                )
+                if construct_identifier(invocation)
+                in identifiers_of_invocations_cancelled_in_this_pass
+                else invocation
+            )
+            for invocation in running_invocations
+        ]
+
+    def handle_running_invocations(
+        self, running_invocations: list[InvocationInfo], time: int
+    ) -> None:
         """
         If an invocation:
           - is in RUNNING status
@@ -107,10 +144,6 @@ class InvocationsLifecycleActions:
         Default case:
         => the invocation should remain in RUNNING status, and nothing should be done
         """
-        running_invocations = self._data_store.invocations.list_all(
-            statuses={InvocationStatus.RUNNING}
-        )
-
         functions_in_ready_status = self._data_store.functions.list_all(
             statuses={FunctionStatus.READY}
         )
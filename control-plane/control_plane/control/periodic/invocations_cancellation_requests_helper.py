@@ -1,11 +1,10 @@
+from collections import deque
 from typing import NamedTuple
 
-from pydantic import BaseModel
-
 from control_plane.types.datatypes import InvocationInfo, ProjectInfo
 
 
-class InvocationsClassificationForCancellationRequests(BaseModel):
+class InvocationsClassificationForCancellationRequests(NamedTuple):
     invocations_to_set_cancellation_requested: list[InvocationInfo]
     invocations_to_leave_untouched: list[InvocationInfo]
 
@@ -13,40 +12,51 @@ class InvocationsClassificationForCancellationRequests(BaseModel):
 def classify_invocations_for_cancellation_requests(
     invocations: list[InvocationInfo], projects: list[ProjectInfo]
 ) -> InvocationsClassificationForCancellationRequests:
-    invocations_to_set_cancellation_requested: list[InvocationInfo] = []
-    invocations_to_leave_untouched: list[InvocationInfo] = []
-
-    # {project_name: project_info}
-    projects_by_name: dict[str, ProjectInfo] = _construct_dict_of_projects_by_name(
-        projects
+    names_of_projects_being_deleted = frozenset(
+        project.project_name for project in projects if project.deletion_requested
     )
 
-    # Optimisation: iterate over invocations in the order in which they were created.
-    # This usually means that we can propagate cancellation requests from grandparents
-    # to grandchildren in a single pass, giving rise to better user experience.
-    sorted_invocations = sorted(invocations, key=(lambda inv: inv.creation_time))
+    # {parent identifier: [child invocations]}
+    children_by_parent = _construct_dict_of_children_by_parent(invocations)
 
-    invocations_cancelled_in_this_pass: set[InvocationIdentifier] = set()
+    # Seed the search with the invocations that need a cancellation request for reasons of their own.
+    # NB a parent that was cancelled in a previous pass may no longer be running, so it need not be in the list.
+    invocations_to_cancel: set[InvocationIdentifier] = set()
+    queue: deque[InvocationInfo] = deque()
 
-    for invocation in sorted_invocations:
+    for invocation in invocations:
         if invocation.cancellation_requested:
             # Already has a cancellation request => No need to set it again
-            invocations_to_leave_untouched.append(invocation)
-        elif (
-            invocation.project_name in projects_by_name
-            and projects_by_name[invocation.project_name].deletion_requested
+            continue
+        elif invocation.project_name in names_of_projects_being_deleted or (
+            invocation.parent_invocation is not None
+            and invocation.parent_invocation.cancellation_requested
         ):
-            # Project is being deleted, so cancel the invocation
-            # NB the "invocation.project_name in projects_by_name" check is technically redundant -
-            # we are coding defensively in case of future edits.
-            invocations_to_set_cancellation_requested.append(invocation)
-            invocations_cancelled_in_this_pass.add(_construct_identifier(invocation))
-        elif _has_cancelled_parent(invocation, invocations_cancelled_in_this_pass):
-            # Parent has a cancellation request, so cancel this invocation too
+            # Project is being deleted, or parent has a cancellation request, so cancel the invocation
+            invocations_to_cancel.add(construct_identifier(invocation))
+            queue.append(invocation)
+
+    # Propagate the cancellation requests set in this pass down to children, grandchildren, etc.
+    # Each invocation is queued at most once, so the whole pass is linear in the number of invocations,
+    # and propagation does not depend on the order of the list.
+    while queue:
+        invocation = queue.popleft()
+        for child in children_by_parent.get(construct_identifier(invocation), []):
+            child_identifier = construct_identifier(child)
+            if (
+                not child.cancellation_requested
+                and child_identifier not in invocations_to_cancel
+            ):
+                invocations_to_cancel.add(child_identifier)
+                queue.append(child)
+
+    invocations_to_set_cancellation_requested: list[InvocationInfo] = []
+    invocations_to_leave_untouched: list[InvocationInfo] = []
+
+    for invocation in invocations:
+        if construct_identifier(invocation) in invocations_to_cancel:
             invocations_to_set_cancellation_requested.append(invocation)
-            invocations_cancelled_in_this_pass.add(_construct_identifier(invocation))
         else:
-            # Default: do nothing
             invocations_to_leave_untouched.append(invocation)
 
     return InvocationsClassificationForCancellationRequests(
@@ -62,7 +72,7 @@ class InvocationIdentifier(NamedTuple):
     invocation_id: str
 
 
-def _construct_identifier(invocation: InvocationInfo) -> InvocationIdentifier:
+def construct_identifier(invocation: InvocationInfo) -> InvocationIdentifier:
     return InvocationIdentifier(
         project_name=invocation.project_name,
         version_id=invocation.version_id,
@@ -81,29 +91,12 @@ def _construct_identifier_of_parent(invocation: InvocationInfo) -> InvocationIde
     )
 
 
-def _construct_dict_of_projects_by_name(
-    projects: list[ProjectInfo],
-) -> dict[str, ProjectInfo]:
-    projects_by_name: dict[str, ProjectInfo] = dict()
-    for project in projects:
-        projects_by_name[project.project_name] = project
-    return projects_by_name
-
-
-def _has_cancelled_parent(
-    invocation: InvocationInfo,
-    invocations_cancelled_in_this_pass: set[InvocationIdentifier],
-) -> bool:
-    if invocation.parent_invocation is None:
-        return False
-
-    parent_cancelled_in_previous_pass = (
-        invocation.parent_invocation.cancellation_requested
-    )
-
-    parent_cancelled_in_this_pass = (
-        _construct_identifier_of_parent(invocation)
-        in invocations_cancelled_in_this_pass
-    )
-
-    return parent_cancelled_in_previous_pass or parent_cancelled_in_this_pass
+def _construct_dict_of_children_by_parent(
+    invocations: list[InvocationInfo],
+) -> dict[InvocationIdentifier, list[InvocationInfo]]:
+    children_by_parent: dict[InvocationIdentifier, list[InvocationInfo]] = dict()
+    for invocation in invocations:
+        if invocation.parent_invocation is not None:
+            parent_identifier = _construct_identifier_of_parent(invocation)
+            children_by_parent.setdefault(parent_identifier, []).append(invocation)
+    return children_by_parent
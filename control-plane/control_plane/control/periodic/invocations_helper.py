@@ -1,7 +1,5 @@
 from typing import NamedTuple
 
-from pydantic import BaseModel
-
 from control_plane.types.datatypes import (
     ExecutionOutcome,
     FunctionInfo,
@@ -9,9 +7,14 @@ from control_plane.types.datatypes import (
     WorkerStatus,
 )
 
+# Outcomes after which an invocation needs no further executions.
+# Defined once here: a set display of enum members inside a loop is rebuilt on every iteration.
+OUTCOMES_ENDING_INVOCATION = frozenset(
+    {ExecutionOutcome.SUCCEEDED, ExecutionOutcome.ABORTED}
+)
+
 
-class RunningInvocationsClassification(BaseModel):
-    # Ideally would use NamedTuple, but that's not possible because lists are not hashable in Python.
+class RunningInvocationsClassification(NamedTuple):
     invocations_to_terminate: list[InvocationInfo]
     invocations_to_create_executions_for: list[InvocationInfo]
     invocations_to_leave_untouched: list[InvocationInfo]
@@ -63,7 +66,7 @@ def classify_running_invocations(
             # If invocation has a non-terminated execution, we should leave it as is
             invocations_to_leave_untouched.append(invocation)
         elif any(
-            execution.outcome in {ExecutionOutcome.SUCCEEDED, ExecutionOutcome.ABORTED}
+            execution.outcome in OUTCOMES_ENDING_INVOCATION
             for execution in invocation.executions
         ):
             # If invocation has finished running successfully, we should terminate it
@@ -1,9 +1,9 @@
-from pydantic import BaseModel
+from typing import NamedTuple
 
 from control_plane.types.datatypes import InvocationInfo, ProjectInfo
 
 
-class ProjectsClassificationForDeletion(BaseModel):
+class ProjectsClassificationForDeletion(NamedTuple):
     projects_to_delete: list[ProjectInfo]
     projects_to_leave_untouched: list[ProjectInfo]
 
@@ -8,6 +8,7 @@ from control_plane.data.versions import VersionsTable
 
 class DataStore:
     def __init__(self, pool: SqlConnectionPool) -> None:
+        self._pool = pool
         self._projects = ProjectsTable(pool)
         self._project_versions = VersionsTable(pool)
         self._functions = FunctionsTable(pool)
@@ -30,6 +31,16 @@ class DataStore:
         self._project_versions._delete_table()
         self._projects._delete_table()
 
+    def clear_tables(self) -> None:
+        # Deletes every row but keeps the schema. Much cheaper than deleting and recreating the tables.
+        # All tables are truncated in a single statement, so the order does not matter for foreign keys.
+        with self._pool.cursor() as cursor:
+            cursor.execute(
+                """
+                TRUNCATE executions, invocations, functions, project_versions, projects;
+                """
+            )
+
     @property
     def projects(self) -> ProjectsTable:
         return self._projects
@@ -15,6 +15,7 @@ from control_plane.types.api_errors import (
     InvocationDoesNotExist,
 )
 from control_plane.types.datatypes import (
+    ExecutionHeader,
     ExecutionInfo,
     ExecutionOutcome,
     ExecutionsListForInvocation,
@@ -361,7 +362,6 @@ class ExecutionsTable:
                   executions.function_name,
                   executions.invocation_id,
                   executions.execution_id,
-                  invocations.input,
                   invocations.cancellation_request_time,
                   functions.resource_spec,
                   functions.execution_spec,
@@ -371,13 +371,14 @@ class ExecutionsTable:
                   executions.worker_details,
                   executions.termination_signal_time,
                   executions.outcome,
-                  executions.output,
-                  executions.error_message,
                   executions.creation_time,
                   executions.last_update_time,
                   executions.execution_start_time,
                   executions.execution_finish_time,
-                  invocations.creation_time
+                  invocations.creation_time,
+                  invocations.input,
+                  executions.output,
+                  executions.error_message
                 FROM functions
                 INNER JOIN invocations USING (project_name, version_id, function_name)
                 INNER JOIN executions USING (project_name, version_id, function_name, invocation_id)
@@ -397,8 +398,10 @@ class ExecutionsTable:
 
             return _construct_execution_info_from_row(row)
 
-    def list_all(self, *, worker_statuses: set[WorkerStatus]) -> list[ExecutionInfo]:
+    def list_all(self, *, worker_statuses: set[WorkerStatus]) -> list[ExecutionHeader]:
         """
+        Returns execution headers, i.e. without the input, output and error message fields.
+
         The worker_statuses argument must be populated. It is unwise to call this method with the TERMINATED status,
         since that is likely to return a very large number of results.
         """
@@ -414,7 +417,6 @@ class ExecutionsTable:
                   executions.function_name,
                   executions.invocation_id,
                   executions.execution_id,
-                  invocations.input,
                   invocations.cancellation_request_time,
                   functions.resource_spec,
                   functions.execution_spec,
@@ -424,8 +426,6 @@ class ExecutionsTable:
                   executions.worker_details,
                   executions.termination_signal_time,
                   executions.outcome,
-                  executions.output,
-                  executions.error_message,
                   executions.creation_time,
                   executions.last_update_time,
                   executions.execution_start_time,
@@ -443,37 +443,51 @@ class ExecutionsTable:
 
             rows = cursor.fetchall()
 
-            return [_construct_execution_info_from_row(row) for row in rows]
+            return [_construct_execution_header_from_row(row) for row in rows]
+
+
+# The rows below were validated when they were written, so the models are built with model_construct,
+# which skips validation. This means that enum fields must be converted explicitly.
 
 
 def _construct_execution_info_from_row(row: Tuple[Any, ...]) -> ExecutionInfo:
-    return ExecutionInfo(
-        project_name=row[0],
-        version_id=row[1],
-        function_name=row[2],
-        invocation_id=row[3],
-        execution_id=row[4],
-        input=row[5],
-        cancellation_request_time=row[6],
-        resource_spec=ResourceSpec.model_validate_json(row[7]),
-        execution_spec=ExecutionSpec.model_validate_json(row[8]),
-        function_status=FunctionStatus(row[9]),
-        prepared_function_details=(
-            PreparedFunctionDetails.model_validate_json(row[10])
-            if row[10] is not None
+    return ExecutionInfo.model_construct(
+        **_execution_header_fields_from_row(row),
+        input=row[19],
+        output=row[20],
+        error_message=row[21],
+    )
+
+
+def _construct_execution_header_from_row(row: Tuple[Any, ...]) -> ExecutionHeader:
+    return ExecutionHeader.model_construct(**_execution_header_fields_from_row(row))
+
+
+def _execution_header_fields_from_row(row: Tuple[Any, ...]) -> dict[str, Any]:
+    return {
+        "project_name": row[0],
+        "version_id": row[1],
+        "function_name": row[2],
+        "invocation_id": row[3],
+        "execution_id": row[4],
+        "cancellation_request_time": row[5],
+        "resource_spec": ResourceSpec.model_validate_json(row[6]),
+        "execution_spec": ExecutionSpec.model_validate_json(row[7]),
+        "function_status": FunctionStatus(row[8]),
+        "prepared_function_details": (
+            PreparedFunctionDetails.model_validate_json(row[9])
+            if row[9] is not None
             else None
         ),
-        worker_status=WorkerStatus(row[11]),
-        worker_details=(
-            WorkerDetails.model_validate_json(row[12]) if row[12] is not None else None
+        "worker_status": WorkerStatus(row[10]),
+        "worker_details": (
+            WorkerDetails.model_validate_json(row[11]) if row[11] is not None else None
         ),
-        termination_signal_time=row[13],
-        outcome=(ExecutionOutcome(row[14]) if row[14] is not None else None),
-        output=row[15],
-        error_message=row[16],
-        creation_time=row[17],
-        last_update_time=row[18],
-        execution_start_time=row[19],
-        execution_finish_time=row[20],
-        invocation_creation_time=row[21],
-    )
+        "termination_signal_time": row[12],
+        "outcome": (ExecutionOutcome(row[13]) if row[13] is not None else None),
+        "creation_time": row[14],
+        "last_update_time": row[15],
+        "execution_start_time": row[16],
+        "execution_finish_time": row[17],
+        "invocation_creation_time": row[18],
+    }
@@ -216,7 +216,7 @@ class FunctionsTable:
 
 
 def _construct_function_info_from_row(row: Tuple[Any, ...]) -> FunctionInfo:
-    return FunctionInfo(
+    return FunctionInfo.model_construct(
         project_name=row[0],
         version_id=row[1],
         function_name=row[2],
@@ -458,7 +458,7 @@ class InvocationsTable:
                     parent_invocation_def = None
 
                 invocations.append(
-                    InvocationInfoForFunction(
+                    InvocationInfoForFunction.model_construct(
                         invocation_id=row[0],
                         parent_invocation=parent_invocation_def,
                         cancellation_request_time=row[3],
@@ -476,7 +476,7 @@ class InvocationsTable:
             else:
                 next_offset = None
 
-            return InvocationsListForFunction(
+            return InvocationsListForFunction.model_construct(
                 project_name=project_name,
                 version_id=version_id,
                 function_name=function_name,
@@ -572,9 +572,13 @@ class InvocationsTable:
             return invocations
 
 
+# The rows below were validated when they were written, so the models are built with model_construct,
+# which skips validation. This means that enum fields must be converted explicitly.
+
+
 def _construct_invocation_info_from_row(row: Tuple[Any, ...]) -> InvocationInfo:
     if row[4] is not None:
-        parent_invocation = ParentInvocationInfo(
+        parent_invocation = ParentInvocationInfo.model_construct(
             function_name=row[4],
             invocation_id=row[5],
             cancellation_request_time=row[6],
@@ -585,7 +589,7 @@ def _construct_invocation_info_from_row(row: Tuple[Any, ...]) -> InvocationInfo:
     else:
         parent_invocation = None
 
-    return InvocationInfo(
+    return InvocationInfo.model_construct(
         project_name=row[0],
         version_id=row[1],
         function_name=row[2],
@@ -609,7 +613,7 @@ def _construct_invocation_info_from_row(row: Tuple[Any, ...]) -> InvocationInfo:
 
 
 def _construct_execution_summary_from_row(row: Tuple[Any, ...]) -> ExecutionSummary:
-    return ExecutionSummary(
+    return ExecutionSummary.model_construct(
         execution_id=row[0],
         worker_status=WorkerStatus(row[1]),
         worker_details=(
@@ -141,7 +141,7 @@ class ProjectsTable:
             rows = cursor.fetchall()
 
             projects = [
-                ProjectInfo(
+                ProjectInfo.model_construct(
                     project_name=row[0],
                     deletion_request_time=row[1],
                     creation_time=row[2],
@@ -149,7 +149,7 @@ class ProjectsTable:
                 for row in rows
             ]
 
-            return ProjectsList(projects=projects)
+            return ProjectsList.model_construct(projects=projects)
 
     def delete_with_cascade(self, *, project_name: str) -> None:
         """
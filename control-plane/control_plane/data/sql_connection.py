@@ -4,12 +4,27 @@ from typing import Iterator
 import psycopg2
 from psycopg2 import pool
 
+# The pool opens min_connections connections up front, and keeps that many open when they are returned.
+# Any connections above this number are closed as soon as they are returned, so concurrent requests
+# beyond it would each pay for opening a new connection. The loop is single-threaded and only ever needs one.
+DEFAULT_MIN_CONNECTIONS = 1
+DEFAULT_MAX_CONNECTIONS = 20
+
 
 class SqlConnectionPool:
-    def __init__(self, host: str, port: int, db: str, user: str, password: str):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        db: str,
+        user: str,
+        password: str,
+        min_connections: int = DEFAULT_MIN_CONNECTIONS,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ):
         self._connection_pool = pool.ThreadedConnectionPool(
-            minconn=1,
-            maxconn=20,
+            minconn=min_connections,
+            maxconn=max_connections,
             host=host,
             port=port,
             database=db,
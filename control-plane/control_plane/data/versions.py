@@ -135,7 +135,7 @@ class VersionsTable:
             if row is None:
                 raise VersionDoesNotExist
 
-            version = VersionInfo(
+            version = VersionInfo.model_construct(
                 project_name=row[0],
                 version_id=row[1],
                 creation_time=row[2],
@@ -162,7 +162,7 @@ class VersionsTable:
 
             for row in rows:
                 version.functions.append(
-                    FunctionInfoForVersion(
+                    FunctionInfoForVersion.model_construct(
                         function_name=row[0],
                         docker_image=row[1],
                         resource_spec=ResourceSpec.model_validate_json(row[2]),
@@ -202,8 +202,12 @@ class VersionsTable:
             rows = cursor.fetchall()
 
             versions = [
-                VersionInfoForProject(version_id=row[0], creation_time=row[1])
+                VersionInfoForProject.model_construct(
+                    version_id=row[0], creation_time=row[1]
+                )
                 for row in rows
             ]
 
-            return VersionsListForProject(project_name=project_name, versions=versions)
+            return VersionsListForProject.model_construct(
+                project_name=project_name, versions=versions
+            )
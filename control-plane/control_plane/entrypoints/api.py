@@ -14,6 +14,7 @@ from control_plane.entrypoints.utils.repository_credentials_setup import (
     credentials_loader_from_environment_variables,
 )
 from control_plane.entrypoints.utils.sql_setup import (
+    api_min_connections_from_environment_variables,
     datastore_from_environment_variables,
 )
 
@@ -27,8 +28,9 @@ def main() -> None:
     provisioner = provisioner_from_environment_variables(cli_args)
     credentials_loader = credentials_loader_from_environment_variables(cli_args)
     authenticator = authenticator_from_environment_variables()
+    min_connections = api_min_connections_from_environment_variables()
 
-    with datastore_from_environment_variables(cli_args) as data_store:
+    with datastore_from_environment_variables(cli_args, min_connections) as data_store:
         app = build_app(data_store, provisioner, credentials_loader, authenticator)
         uvicorn.run(app, host="0.0.0.0", port=5000)
 
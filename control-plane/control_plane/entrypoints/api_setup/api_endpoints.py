@@ -4,7 +4,7 @@ from fastapi import Depends, FastAPI
 from fastapi.routing import APIRoute
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
 from control_plane.control.api.all import ApiHandler
 from control_plane.data.data_store import DataStore
@@ -13,8 +13,10 @@ from control_plane.docker.credentials_loader import (
 )
 from control_plane.entrypoints.utils.current_time import current_time
 from control_plane.entrypoints.utils.documentation import document_possible_errors
+from control_plane.entrypoints.utils.model_response import build_model_response
 from control_plane.provisioning.provisioner import AbstractProvisioner
 from control_plane.types.api_errors import (
+    ENCODED_ERROR_RESPONSES,
     ApiError,
     ApiKeyIsInvalid,
     ExecutionDoesNotExist,
@@ -32,6 +34,7 @@ from control_plane.types.api_errors import (
     ProjectAlreadyExists,
     ProjectDoesNotExist,
     ProjectIsBeingDeleted,
+    ProjectNameIsTooLong,
     VersionDoesNotExist,
 )
 from control_plane.types.datatypes import (
@@ -91,7 +94,9 @@ def build_app(
 
     @app.put(
         path="/projects/{project_name}",
-        responses=document_possible_errors([ProjectAlreadyExists, ApiKeyIsInvalid]),
+        responses=document_possible_errors([
+            ProjectAlreadyExists, ProjectNameIsTooLong, ApiKeyIsInvalid,
+        ]),
     )
     def create_project(
             project_name: str, auth_info: AuthResult = Depends(authenticate)
@@ -121,9 +126,13 @@ def build_app(
     ) -> ProjectInfo:
         return api_handler.registration.get_project(project_name=project_name)
 
-    @app.get(path="/projects", responses=document_possible_errors([ApiKeyIsInvalid]))
-    def list_projects(auth_info: AuthResult = Depends(authenticate)) -> ProjectsList:
-        return api_handler.registration.list_projects()
+    @app.get(
+        path="/projects",
+        response_model=ProjectsList,
+        responses=document_possible_errors([ApiKeyIsInvalid]),
+    )
+    def list_projects(auth_info: AuthResult = Depends(authenticate)) -> Response:
+        return build_model_response(api_handler.registration.list_projects())
 
     @app.post(
         path="/projects/{project_name}/versions",
@@ -158,17 +167,21 @@ def build_app(
 
     @app.get(
         path="/projects/{project_name}/versions",
+        response_model=VersionsListForProject,
         responses=document_possible_errors([ProjectDoesNotExist, ApiKeyIsInvalid]),
     )
     def list_project_versions(
             project_name: str, auth_info: AuthResult = Depends(authenticate)
-    ) -> VersionsListForProject:
-        return api_handler.registration.list_project_versions(project_name=project_name)
+    ) -> Response:
+        return build_model_response(
+            api_handler.registration.list_project_versions(project_name=project_name)
+        )
 
     # Invocation endpoints - called by internal/external code invoking the functions
 
     @app.post(
         path="/projects/{project_name}/versions/{version_ref_str}/functions/{function_name}/invocations",
+        response_model_exclude_none=True,
         responses=document_possible_errors([
             ProjectDoesNotExist, VersionDoesNotExist, FunctionDoesNotExist,
             ParentInvocationDoesNotExist, ApiKeyIsInvalid,
@@ -193,6 +206,7 @@ def build_app(
     @app.put(
         path="/projects/{project_name}/versions/{version_ref_str}/functions/{function_name}/"
              "invocations/{invocation_id}/cancel",
+        response_model_exclude_none=True,
         responses=document_possible_errors([
             ProjectDoesNotExist, VersionDoesNotExist, FunctionDoesNotExist,
             InvocationDoesNotExist, InvocationIsAlreadyTerminated, ApiKeyIsInvalid,
@@ -217,6 +231,7 @@ def build_app(
     @app.get(
         path="/projects/{project_name}/versions/{version_ref_str}/functions/{function_name}/"
              "invocations/{invocation_id}",
+        response_model=InvocationInfo,
         responses=document_possible_errors([
             ProjectDoesNotExist, VersionDoesNotExist, FunctionDoesNotExist,
             InvocationDoesNotExist, ApiKeyIsInvalid,
@@ -228,17 +243,19 @@ def build_app(
             function_name: str,
             invocation_id: str,
             auth_info: AuthResult = Depends(authenticate),
-    ) -> InvocationInfo:
+    ) -> Response:
         version_ref = parse_version_reference(version_ref_str)
-        return api_handler.invocation.get_invocation(
+        invocation = api_handler.invocation.get_invocation(
             project_name=project_name,
             version_ref=version_ref,
             function_name=function_name,
             invocation_id=invocation_id,
         )
+        return build_model_response(invocation, exclude_none=True)
 
     @app.get(
         path="/projects/{project_name}/versions/{version_ref_str}/functions/{function_name}/invocations",
+        response_model=InvocationsListForFunction,
         responses=document_possible_errors([
             ProjectDoesNotExist, VersionDoesNotExist, FunctionDoesNotExist,
             OffsetIsInvalid, ParentFunctionNameIsMissing, ParentInvocationIdIsMissing,
@@ -255,12 +272,12 @@ def build_app(
             parent_function_name: Optional[str] = None,
             parent_invocation_id: Optional[str] = None,
             auth_info: AuthResult = Depends(authenticate),
-    ) -> InvocationsListForFunction:
+    ) -> Response:
         version_ref = parse_version_reference(version_ref_str)
         parent_invocation = parse_parent_invocation_definition(
             parent_function_name, parent_invocation_id
         )
-        return api_handler.invocation.list_invocations(
+        invocations = api_handler.invocation.list_invocations(
             project_name=project_name,
             version_ref=version_ref,
             function_name=function_name,
@@ -269,12 +286,14 @@ def build_app(
             status=status,
             parent_invocation=parent_invocation,
         )
+        return build_model_response(invocations, exclude_none=True)
 
     # Execution endpoints - called by workers running the functions
 
     @app.put(
         path="/projects/{project_name}/versions/{version_ref_str}/functions/{function_name}/"
              "invocations/{invocation_id}/executions/{execution_id}/start",
+        response_model_exclude_none=True,
         responses=document_possible_errors([
             ProjectDoesNotExist, VersionDoesNotExist, FunctionDoesNotExist,
             InvocationDoesNotExist, ExecutionDoesNotExist, ExecutionHasAlreadyStarted,
@@ -302,6 +321,7 @@ def build_app(
     @app.put(
         path="/projects/{project_name}/versions/{version_ref_str}/functions/{function_name}/"
              "invocations/{invocation_id}/executions/{execution_id}/update",
+        response_model_exclude_none=True,
         responses=document_possible_errors([
             ProjectDoesNotExist, VersionDoesNotExist, FunctionDoesNotExist,
             InvocationDoesNotExist, ExecutionDoesNotExist, ExecutionHasNotStarted,
@@ -331,6 +351,7 @@ def build_app(
     @app.put(
         path="/projects/{project_name}/versions/{version_ref_str}/functions/{function_name}/"
              "invocations/{invocation_id}/executions/{execution_id}/finish",
+        response_model_exclude_none=True,
         responses=document_possible_errors([
             ProjectDoesNotExist, VersionDoesNotExist, FunctionDoesNotExist,
             InvocationDoesNotExist, ExecutionDoesNotExist, ExecutionHasNotStarted,
@@ -360,6 +381,7 @@ def build_app(
     @app.get(
         path="/projects/{project_name}/versions/{version_ref_str}/functions/{function_name}/"
              "invocations/{invocation_id}/executions/{execution_id}",
+        response_model_exclude_none=True,
         responses=document_possible_errors([
             ProjectDoesNotExist, VersionDoesNotExist, FunctionDoesNotExist,
             InvocationDoesNotExist, ExecutionDoesNotExist, ApiKeyIsInvalid,
@@ -426,9 +448,16 @@ def build_app(
     # Error handling
 
     @app.exception_handler(ApiError)
-    def handle_worker_does_not_exist(request: Request, exc: ApiError) -> JSONResponse:
-        return JSONResponse(
-            status_code=exc.error_code(), content=exc.response().model_dump()
+    def handle_worker_does_not_exist(request: Request, exc: ApiError) -> Response:
+        encoded_error_response = ENCODED_ERROR_RESPONSES.get(type(exc))
+        if encoded_error_response is not None:
+            status_code, content = encoded_error_response
+        else:
+            # Error types that are not direct subclasses of ApiError are not pre-encoded
+            status_code = exc.error_code()
+            content = exc.response().model_dump_json().encode()
+        return Response(
+            status_code=status_code, content=content, media_type="application/json"
         )
 
     use_route_names_as_operation_ids(app)
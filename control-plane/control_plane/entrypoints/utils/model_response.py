@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from starlette.responses import Response
+
+
+def build_model_response(model: BaseModel, exclude_none: bool = False) -> Response:
+    """
+    Serialise an already-validated response model straight to JSON.
+
+    If an endpoint returns a model, FastAPI dumps it to a dict, validates that dict against the response model,
+    and only then encodes it. Models loaded from the data store are already valid, so returning a Response skips
+    that round trip. The endpoint should still declare response_model, so that the OpenAPI schema is unchanged.
+
+    :param model: the response model to serialise
+    :param exclude_none: whether to omit fields whose value is None
+    :return: a JSON response containing the serialised model
+    """
+    return Response(
+        content=model.model_dump_json(exclude_none=exclude_none),
+        media_type="application/json",
+    )
@@ -3,7 +3,7 @@ from contextlib import contextmanager
 from typing import Iterator
 
 from control_plane.data.data_store import DataStore
-from control_plane.data.sql_connection import SqlConnectionPool
+from control_plane.data.sql_connection import DEFAULT_MIN_CONNECTIONS, SqlConnectionPool
 from control_plane.entrypoints.utils.cli_arguments import CliArguments
 from control_plane.entrypoints.utils.environment import (
     get_mandatory_environment_variable,
@@ -14,10 +14,24 @@ POSTGRES_HOST_ENV = "POSTGRES_HOST"
 POSTGRES_DB_ENV = "POSTGRES_DB"
 POSTGRES_USER_ENV = "POSTGRES_USER"
 POSTGRES_PASSWORD_ENV = "POSTGRES_PASSWORD"
+API_POSTGRES_MIN_CONNECTIONS_ENV = "API_POSTGRES_MIN_CONNECTIONS"
+
+# The API serves requests on a thread pool, so it keeps enough connections open for concurrent requests
+DEFAULT_API_MIN_CONNECTIONS = 10
+
+
+def api_min_connections_from_environment_variables() -> int:
+    return int(
+        get_optional_environment_variable_with_default(
+            API_POSTGRES_MIN_CONNECTIONS_ENV, str(DEFAULT_API_MIN_CONNECTIONS)
+        )
+    )
 
 
 @contextmanager
-def datastore_from_environment_variables(cli_args: CliArguments) -> Iterator[DataStore]:
+def datastore_from_environment_variables(
+    cli_args: CliArguments, min_connections: int = DEFAULT_MIN_CONNECTIONS
+) -> Iterator[DataStore]:
     host = get_optional_environment_variable_with_default(
         POSTGRES_HOST_ENV, "localhost"
     )
@@ -27,7 +41,12 @@ def datastore_from_environment_variables(cli_args: CliArguments) -> Iterator[Dat
     password = get_mandatory_environment_variable(POSTGRES_PASSWORD_ENV)
 
     conn_pool = SqlConnectionPool(
-        host=host, port=port, db=db, user=user, password=password
+        host=host,
+        port=port,
+        db=db,
+        user=user,
+        password=password,
+        min_connections=min_connections,
     )
     try:
         data_store = DataStore(conn_pool)
@@ -1,4 +1,6 @@
-from typing import Optional
+import logging
+import time
+from typing import Any, Optional
 
 import boto3
 from botocore.config import Config
@@ -32,6 +34,11 @@ CONTAINER_NAME = "main"
 LOG_STREAM_PREFIX = "ecs"
 TERMINATION_GRACE_PERIOD_SECONDS = 120
 
+# RunTask is retried when ECS rejects it because of a transient limit, e.g. too many tasks in PROVISIONING state.
+# The periodic loop is single-threaded, so the total delay is kept short; a later iteration can try again.
+RUN_TASK_MAX_ATTEMPTS = 4
+RUN_TASK_INITIAL_RETRY_DELAY_SECONDS = 1.0
+
 
 class EcsProvisioner(AbstractProvisioner):
     def __init__(
@@ -136,7 +143,7 @@ class EcsProvisioner(AbstractProvisioner):
     ) -> WorkerDetails:
         task_definition_arn = prepared_function_details.identifier
 
-        response = self._ecs_client.run_task(
+        response = self._run_task_with_retries(
             cluster=self._cluster_name,
             taskDefinition=task_definition_arn,
             networkConfiguration={
@@ -178,6 +185,27 @@ class EcsProvisioner(AbstractProvisioner):
             logs_identifier=log_stream_name,
         )
 
+    def _run_task_with_retries(self, **kwargs: Any) -> Any:
+        attempt = 1
+        delay = RUN_TASK_INITIAL_RETRY_DELAY_SECONDS
+
+        while True:
+            try:
+                return self._ecs_client.run_task(**kwargs)
+            except ClientError as ex:
+                if (
+                    attempt >= RUN_TASK_MAX_ATTEMPTS
+                    or not _is_transient_run_task_error(ex)
+                ):
+                    raise ex
+
+            logging.warning(
+                f"RunTask hit a transient ECS limit (attempt {attempt}), retrying in {delay} seconds"
+            )
+            time.sleep(delay)
+            attempt += 1
+            delay *= 2
+
     def send_termination_signal_to_worker(
         self, *, worker_details: WorkerDetails
     ) -> None:
@@ -250,3 +278,13 @@ class EcsProvisioner(AbstractProvisioner):
                 return LogsResult(log_lines=[], next_offset=None)
             else:
                 raise ex
+
+
+def _is_transient_run_task_error(ex: ClientError) -> bool:
+    error_code = ex.response["Error"]["Code"]
+    if error_code == "ThrottlingException":
+        return True
+    elif error_code == "InvalidParameterException":
+        return "PROVISIONING" in ex.response["Error"].get("Message", "")
+    else:
+        return False
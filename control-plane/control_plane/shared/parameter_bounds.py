@@ -7,3 +7,4 @@ INPUT_LENGTH_LIMIT = 250_000
 OUTPUT_LENGTH_LIMIT = 250_000
 ERROR_MESSAGE_LENGTH_LIMIT = 16384
 FUNCTION_NAME_LENGTH_LIMIT = 1024
+PROJECT_NAME_LENGTH_LIMIT = 64
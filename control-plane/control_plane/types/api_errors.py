@@ -265,3 +265,15 @@ class ProjectDoesNotExist(ApiError):
     @staticmethod
     def error_code() -> int:
         return 404
+
+
+# {error type: (status code, encoded response body)}
+# Built once at import, so that the API's exception handler doesn't need to construct and serialise
+# a new ErrorResponse every time an error is raised.
+ENCODED_ERROR_RESPONSES: dict[type[Exception], tuple[int, bytes]] = {
+    error_type: (
+        error_type.error_code(),
+        ErrorResponse(detail=error_type.error_message()).model_dump_json().encode(),
+    )
+    for error_type in ApiError.__subclasses__()
+}
@@ -1,7 +1,7 @@
-from enum import Enum
-from typing import Optional
+from enum import StrEnum
+from typing import Annotated, Any, Optional
 
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from control_plane.shared.parameter_bounds import (
     ERROR_MESSAGE_LENGTH_LIMIT,
@@ -15,75 +15,25 @@ from control_plane.shared.parameter_bounds import (
     VIRTUAL_CPUS_LIMIT,
 )
 
-
-class StrEnum(str, Enum):
-    def __repr__(self) -> str:
-        return str.__repr__(self.value)
-
-    def __str__(self) -> str:
-        return str.__str__(self.value)
+# Bounds are expressed as Field constraints, rather than as field validators, so that they are checked
+# natively by pydantic-core (and also appear in the OpenAPI schema).
+VirtualCpus = Annotated[float, Field(gt=0, le=VIRTUAL_CPUS_LIMIT)]
+MemoryGbs = Annotated[float, Field(gt=0, le=MEMORY_GBS_LIMIT)]
+MaxConcurrency = Annotated[int, Field(gt=0, le=MAX_CONCURRENCY_LIMIT)]
+MaxRetries = Annotated[int, Field(ge=0, le=MAX_RETRIES_LIMIT)]
+TimeoutSeconds = Annotated[int, Field(gt=0, le=TIMEOUT_SECONDS_LIMIT)]
 
 
 class ResourceSpec(BaseModel):
-    virtual_cpus: float
-    memory_gbs: float
-    max_concurrency: int
+    virtual_cpus: VirtualCpus
+    memory_gbs: MemoryGbs
+    max_concurrency: MaxConcurrency
     # can add GPUs in future
 
-    @field_validator("virtual_cpus")
-    @classmethod
-    def check_valid_virtual_cpus(cls, value: float) -> float:
-        if value <= 0:
-            raise ValueError("virtual_cpus must be positive")
-        if value > VIRTUAL_CPUS_LIMIT:
-            raise ValueError(f"virtual_cpus must not exceed {VIRTUAL_CPUS_LIMIT}")
-
-        return value
-
-    @field_validator("memory_gbs")
-    @classmethod
-    def check_valid_memory_gbs(cls, value: float) -> float:
-        if value <= 0:
-            raise ValueError("memory_gbs must be positive")
-        if value > MEMORY_GBS_LIMIT:
-            raise ValueError(f"memory_gbs must not exceed {MEMORY_GBS_LIMIT}")
-
-        return value
-
-    @field_validator("max_concurrency")
-    @classmethod
-    def check_valid_max_concurrency(cls, value: int) -> int:
-        if value <= 0:
-            raise ValueError("max_concurrency must be positive")
-        if value > MAX_CONCURRENCY_LIMIT:
-            raise ValueError(f"max_concurrency must not exceed {MAX_CONCURRENCY_LIMIT}")
-
-        return value
-
 
 class ExecutionSpec(BaseModel):
-    max_retries: int
-    timeout_seconds: int
-
-    @field_validator("max_retries")
-    @classmethod
-    def check_valid_max_retries(cls, value: int) -> int:
-        if value < 0:
-            raise ValueError("max_retries must be non-negative")
-        if value > MAX_RETRIES_LIMIT:
-            raise ValueError(f"max_retries must not exceed {MAX_RETRIES_LIMIT}")
-
-        return value
-
-    @field_validator("timeout_seconds")
-    @classmethod
-    def check_valid_timeout_seconds(cls, value: int) -> int:
-        if value <= 0:
-            raise ValueError("timeout_seconds must be positive")
-        if value > TIMEOUT_SECONDS_LIMIT:
-            raise ValueError(f"timeout_seconds must not exceed {TIMEOUT_SECONDS_LIMIT}")
-
-        return value
+    max_retries: MaxRetries
+    timeout_seconds: TimeoutSeconds
 
 
 class ExecutionLogs(BaseModel):
@@ -109,13 +59,19 @@ class WorkerType(StrEnum):
     # can add K8s in future
 
 
+# Frozen, so that instances are immutable and hashable. (They are kept as models rather than tuples so that
+# they are still serialised as JSON objects, both in API responses and in the database.)
 class WorkerDetails(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     type: WorkerType
     identifier: str  # e.g. ARN of ECS task
     logs_identifier: str  # e.g. ARN of Cloudwatch log stream for this ECS task
 
 
 class PreparedFunctionDetails(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     type: WorkerType
     identifier: str  # e.g. the ARN of the ECS task definition
 
@@ -182,28 +138,29 @@ class ExecutionFinalResultPayload(BaseModel):
         return self
 
 
-class ExecutionInfo(BaseModel):
+# The Optional fields of the execution and invocation response models default to None.
+# The API omits null fields from these responses, so a missing key should be read as null.
+#
+# ExecutionHeader is an execution without its (potentially large) input, output and error message fields.
+class ExecutionHeader(BaseModel):
     project_name: str
     version_id: str
     function_name: str
     invocation_id: str
     execution_id: str
-    input: str
-    cancellation_request_time: Optional[int]
+    cancellation_request_time: Optional[int] = None
     resource_spec: ResourceSpec
     execution_spec: ExecutionSpec
     function_status: FunctionStatus
-    prepared_function_details: Optional[PreparedFunctionDetails]
+    prepared_function_details: Optional[PreparedFunctionDetails] = None
     worker_status: WorkerStatus
-    worker_details: Optional[WorkerDetails]
-    termination_signal_time: Optional[int]
-    outcome: Optional[ExecutionOutcome]
-    output: Optional[str]
-    error_message: Optional[str]
+    worker_details: Optional[WorkerDetails] = None
+    termination_signal_time: Optional[int] = None
+    outcome: Optional[ExecutionOutcome] = None
     creation_time: int
     last_update_time: int
-    execution_start_time: Optional[int]
-    execution_finish_time: Optional[int]
+    execution_start_time: Optional[int] = None
+    execution_finish_time: Optional[int] = None
     invocation_creation_time: int
 
     @property
@@ -223,18 +180,24 @@ class ExecutionInfo(BaseModel):
         return self.execution_finish_time is not None
 
 
+class ExecutionInfo(ExecutionHeader):
+    input: str
+    output: Optional[str] = None
+    error_message: Optional[str] = None
+
+
 class ExecutionSummary(BaseModel):
     execution_id: str
     worker_status: WorkerStatus
-    worker_details: Optional[WorkerDetails]
-    termination_signal_time: Optional[int]
-    outcome: Optional[ExecutionOutcome]
-    output: Optional[str]
-    error_message: Optional[str]
+    worker_details: Optional[WorkerDetails] = None
+    termination_signal_time: Optional[int] = None
+    outcome: Optional[ExecutionOutcome] = None
+    output: Optional[str] = None
+    error_message: Optional[str] = None
     creation_time: int
     last_update_time: int
-    execution_start_time: Optional[int]
-    execution_finish_time: Optional[int]
+    execution_start_time: Optional[int] = None
+    execution_finish_time: Optional[int] = None
 
     @property
     def termination_signal_sent(self) -> bool:
@@ -282,7 +245,7 @@ class InvocationDefinition(BaseModel):
 class ParentInvocationInfo(BaseModel):
     function_name: str
     invocation_id: str
-    cancellation_request_time: Optional[int]
+    cancellation_request_time: Optional[int] = None
     invocation_status: InvocationStatus
     creation_time: int
     last_update_time: int
@@ -297,13 +260,13 @@ class InvocationInfo(BaseModel):
     version_id: str
     function_name: str
     invocation_id: str
-    parent_invocation: Optional[ParentInvocationInfo]
+    parent_invocation: Optional[ParentInvocationInfo] = None
     resource_spec: ResourceSpec
     execution_spec: ExecutionSpec
     function_status: FunctionStatus
-    prepared_function_details: Optional[PreparedFunctionDetails]
+    prepared_function_details: Optional[PreparedFunctionDetails] = None
     input: str
-    cancellation_request_time: Optional[int]
+    cancellation_request_time: Optional[int] = None
     invocation_status: InvocationStatus
     creation_time: int
     last_update_time: int
@@ -316,8 +279,8 @@ class InvocationInfo(BaseModel):
 
 class InvocationInfoForFunction(BaseModel):
     invocation_id: str
-    parent_invocation: Optional[ParentInvocationDefinition]
-    cancellation_request_time: Optional[int]
+    parent_invocation: Optional[ParentInvocationDefinition] = None
+    cancellation_request_time: Optional[int] = None
     invocation_status: InvocationStatus
     creation_time: int
     last_update_time: int
@@ -332,7 +295,7 @@ class InvocationsListForFunction(BaseModel):
     version_id: str
     function_name: str
     invocations: list[InvocationInfoForFunction]
-    next_offset: Optional[str]
+    next_offset: Optional[str] = None
 
 
 class FunctionSpec(BaseModel):
@@ -385,6 +348,8 @@ class FunctionInfo(BaseModel):
 
 
 class FunctionsListForVersion(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     project_name: str
     version_id: str
     functions: list[FunctionInfoForVersion]
@@ -401,15 +366,28 @@ class VersionDefinition(BaseModel):
             raise ValueError("default_docker_image cannot exceed 1024 characters")
         return value
 
-    @model_validator(mode="after")
-    def check_no_duplicate_function_names(self) -> "VersionDefinition":
-        distinct_function_names = set(
-            function.function_name for function in self.functions
-        )
-        if len(distinct_function_names) < len(self.functions):
-            raise ValueError("function_name values must be distinct")
+    @model_validator(mode="before")
+    @classmethod
+    def check_no_duplicate_function_names(cls, data: Any) -> Any:
+        # Runs on the raw input, so that duplicates are rejected before any of the function specs are validated.
+        # Input that is malformed in other ways is passed through, to be rejected by the field validation.
+        if not isinstance(data, dict) or not isinstance(data.get("functions"), list):
+            return data
 
-        return self
+        distinct_function_names: set[str] = set()
+        for function in data["functions"]:
+            if isinstance(function, dict):
+                function_name = function.get("function_name")
+            else:
+                function_name = getattr(function, "function_name", None)
+
+            if not isinstance(function_name, str):
+                continue
+            if function_name in distinct_function_names:
+                raise ValueError("function_name values must be distinct")
+            distinct_function_names.add(function_name)
+
+        return data
 
 
 class VersionInfo(BaseModel):
@@ -427,6 +405,8 @@ class VersionInfoForProject(BaseModel):
 
 
 class VersionsListForProject(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     project_name: str
     versions: list[VersionInfoForProject]
 
@@ -442,10 +422,14 @@ class ProjectInfo(BaseModel):
 
 
 class ProjectsList(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     projects: list[ProjectInfo]
 
 
 class HealthStatus(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     status: str
 
 
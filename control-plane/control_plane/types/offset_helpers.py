@@ -1,24 +1,31 @@
+import base64
+import struct
 from typing import NamedTuple
 
 from control_plane.types.api_errors import OffsetIsInvalid
 
+# The offset is opaque to clients: an 8-byte big-endian creation time followed by the UTF-8 encoded id,
+# base64-encoded so that it is safe to use in a URL.
+_CREATION_TIME_FORMAT = struct.Struct(">q")
+
 
 class ListOffset(NamedTuple):
     next_creation_time: int
     next_id: str
 
     def serialise(self) -> str:
-        return f"{self.next_creation_time},{self.next_id}"
+        packed = _CREATION_TIME_FORMAT.pack(self.next_creation_time)
+        return base64.urlsafe_b64encode(packed + self.next_id.encode()).decode()
 
     @classmethod
     def deserialise(cls, offset_str: str) -> "ListOffset":
         try:
-            index_of_first_comma = offset_str.index(",")
-            next_creation_time = int(offset_str[:index_of_first_comma])
-            next_id = offset_str[index_of_first_comma + 1 :]
-
-            return ListOffset(next_creation_time=next_creation_time, next_id=next_id)
-
-        except ValueError:
-            # Raised if (i) no comma is found, (ii) the next creation time is not an int
+            packed = base64.urlsafe_b64decode(offset_str)
+            (next_creation_time,) = _CREATION_TIME_FORMAT.unpack_from(packed)
+            next_id = packed[_CREATION_TIME_FORMAT.size :].decode()
+        except (ValueError, struct.error):
+            # Raised if (i) the offset is not ASCII or not valid base64, (ii) it is too short to contain a
+            # creation time, (iii) the id is not valid UTF-8
             raise OffsetIsInvalid
+
+        return ListOffset(next_creation_time=next_creation_time, next_id=next_id)
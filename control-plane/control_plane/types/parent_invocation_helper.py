@@ -11,13 +11,15 @@ from control_plane.types.datatypes import ParentInvocationDefinition
 def parse_parent_invocation_definition(
     parent_function_name: Optional[str], parent_invocation_id: Optional[str]
 ) -> Optional[ParentInvocationDefinition]:
-    if parent_function_name is not None and parent_invocation_id is not None:
-        return ParentInvocationDefinition(
-            function_name=parent_function_name, invocation_id=parent_invocation_id
-        )
-    elif parent_function_name is None and parent_invocation_id is not None:
-        raise ParentFunctionNameIsMissing
-    elif parent_function_name is not None and parent_invocation_id is None:
-        raise ParentInvocationIdIsMissing
-    else:
+    # Each argument is checked at most once. The common case (no parent filter) is handled first.
+    if parent_invocation_id is None:
+        if parent_function_name is not None:
+            raise ParentInvocationIdIsMissing
         return None
+
+    if parent_function_name is None:
+        raise ParentFunctionNameIsMissing
+
+    return ParentInvocationDefinition(
+        function_name=parent_function_name, invocation_id=parent_invocation_id
+    )
@@ -1,6 +1,7 @@
+from control_plane.shared.parameter_bounds import PROJECT_NAME_LENGTH_LIMIT
 from control_plane.types.api_errors import ProjectNameIsTooLong
 
 
 def check_project_name_length(project_name: str) -> None:
-    if len(project_name) > 64:
+    if len(project_name) > PROJECT_NAME_LENGTH_LIMIT:
         raise ProjectNameIsTooLong
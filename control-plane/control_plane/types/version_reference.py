@@ -14,10 +14,16 @@ class VersionReference(NamedTuple):
 
 LATEST_STR = "latest"
 
+# Immutable, so a single instance can be shared by every request that refers to the latest version.
+LATEST_VERSION_REFERENCE = VersionReference(
+    type=VersionReferenceType.LATEST, named_version_id=None
+)
+
 
 def parse_version_reference(version_id_str: str) -> VersionReference:
-    if version_id_str.lower() == LATEST_STR:
-        return VersionReference(type=VersionReferenceType.LATEST, named_version_id=None)
+    # Generated version ids are much longer than "latest", so the length check skips lower() for them.
+    if len(version_id_str) == len(LATEST_STR) and version_id_str.lower() == LATEST_STR:
+        return LATEST_VERSION_REFERENCE
     else:
         return VersionReference(
             type=VersionReferenceType.NAMED, named_version_id=version_id_str
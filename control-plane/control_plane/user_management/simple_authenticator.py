@@ -1,3 +1,5 @@
+import hmac
+
 from control_plane.types.api_errors import ApiKeyIsInvalid
 from control_plane.user_management.authenticator import (
     AbstractAuthenticator,
@@ -11,10 +13,19 @@ class SimpleAuthenticator(AbstractAuthenticator):
     USER_NAME = "root"
 
     def __init__(self, api_key: str):
-        self._api_key = api_key
+        # Keep the key as bytes, because compare_digest only accepts ASCII strings
+        self._api_key_bytes = api_key.encode()
+        self._api_key_length = len(api_key)
+        # There is only one possible successful result, so build it once
+        self._success_result = AuthResult(user=self.USER_NAME)
 
     def authenticate(self, api_key: str) -> AuthResult:
-        if api_key == self._api_key:
-            return AuthResult(user=self.USER_NAME)
+        # Rejecting keys of the wrong length early only reveals the key's length, which is standard practice
+        if len(api_key) != self._api_key_length:
+            raise ApiKeyIsInvalid
+
+        # Constant-time comparison, so that response times do not reveal how much of the key matched
+        if hmac.compare_digest(api_key.encode(), self._api_key_bytes):
+            return self._success_result
         else:
             raise ApiKeyIsInvalid
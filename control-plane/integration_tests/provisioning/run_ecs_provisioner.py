@@ -1,5 +1,11 @@
+import os
+import random
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+
+import boto3
+from botocore.config import Config
 
 from control_plane.provisioning.ecs_provisioner import EcsProvisioner
 from control_plane.types.datatypes import (
@@ -32,6 +38,16 @@ TASK_ROLE_ARN = "arn:aws:iam::921216064263:role/MultinodeTaskRole"
 EXECUTION_ROLE_ARN = "arn:aws:iam::921216064263:role/ecsTaskExecutionRole"
 LOG_GROUP = "/ecs/multinode-workers"
 
+# Polls for new worker logs back off exponentially, from the initial delay up to the maximum delay.
+# Jitter is added, so that parallel runs don't poll in lockstep.
+INITIAL_WORKER_POLL_DELAY_SECONDS = 1.0
+WORKER_POLL_DELAY_SECONDS = float(os.getenv("WORKER_POLL_DELAY_SECONDS", "15"))
+
+# Delay between the DescribeTasks calls made while waiting for the worker to stop.
+# Increase this if many integration tests run in parallel, to avoid being rate limited.
+AWS_POLL_DELAY_SECONDS = int(os.getenv("AWS_POLL_DELAY_SECONDS", "6"))
+TERMINATION_WAIT_MAX_ATTEMPTS = 100
+
 # Be careful with interrupting this!!! You may leave tasks running in our AWS account, which will cost money.
 
 
@@ -79,11 +95,13 @@ def main() -> None:
 
     num_logs_pages_containing_at_least_one_line = 0
 
+    poll_delays = generate_poll_delays()
+
     while (
         num_logs_pages_containing_at_least_one_line
         < MIN_LOG_PAGES_WITH_AT_LEAST_ONE_LINE
     ):
-        time.sleep(15)
+        time.sleep(next(poll_delays))
 
         logs_page = provisioner.get_worker_logs(
             worker_details=worker_details,
@@ -100,11 +118,10 @@ def main() -> None:
 
     provisioner.send_termination_signal_to_worker(worker_details=worker_details)
 
-    while status == WorkerStatus.RUNNING:
-        time.sleep(15)
+    wait_for_termination(worker_details)
 
-        status = provisioner.check_worker_status(worker_details=worker_details)
-        print("Status:", status)
+    status = provisioner.check_worker_status(worker_details=worker_details)
+    print("Status:", status)
 
     assert status == WorkerStatus.TERMINATED
 
@@ -119,21 +136,48 @@ def main() -> None:
         ),
     )
 
-    status_of_nonexistent_worker = provisioner.check_worker_status(
-        worker_details=nonexistent_worker_details
-    )
+    # These two checks are independent, so make the AWS calls in parallel (boto3 clients are thread-safe)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        status_future = executor.submit(
+            provisioner.check_worker_status, worker_details=nonexistent_worker_details
+        )
+        logs_future = executor.submit(
+            provisioner.get_worker_logs,
+            worker_details=nonexistent_worker_details,
+            max_lines=3,
+            initial_offset=None,
+        )
+        status_of_nonexistent_worker = status_future.result()
+        logs_result_for_nonexistent_worker = logs_future.result()
+
     print("Status of non-existent worker:", status_of_nonexistent_worker)
 
     assert status_of_nonexistent_worker == WorkerStatus.TERMINATED
 
-    logs_result_for_nonexistent_worker = provisioner.get_worker_logs(
-        worker_details=nonexistent_worker_details, max_lines=3, initial_offset=None
-    )
     print("Logs page for non-existent worker:", logs_result_for_nonexistent_worker)
 
     assert len(logs_result_for_nonexistent_worker.log_lines) == 0
     assert logs_result_for_nonexistent_worker.next_offset is None
 
 
+def generate_poll_delays() -> Iterator[float]:
+    delay = INITIAL_WORKER_POLL_DELAY_SECONDS
+    while True:
+        yield min(delay, WORKER_POLL_DELAY_SECONDS) * random.uniform(0.8, 1.2)
+        delay *= 2
+
+
+def wait_for_termination(worker_details: WorkerDetails) -> None:
+    ecs_client = boto3.client("ecs", config=Config(region_name=AWS_REGION))
+    ecs_client.get_waiter("tasks_stopped").wait(
+        cluster=CLUSTER_NAME,
+        tasks=[worker_details.identifier],
+        WaiterConfig={
+            "Delay": AWS_POLL_DELAY_SECONDS,
+            "MaxAttempts": TERMINATION_WAIT_MAX_ATTEMPTS,
+        },
+    )
+
+
 if __name__ == "__main__":
     main()
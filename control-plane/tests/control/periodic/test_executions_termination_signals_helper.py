@@ -5,7 +5,7 @@ from control_plane.control.periodic.executions_termination_signals_helper import
     classify_running_executions_for_termination_signals,
 )
 from control_plane.types.datatypes import (
-    ExecutionInfo,
+    ExecutionHeader,
     ExecutionSpec,
     FunctionStatus,
     ResourceSpec,
@@ -23,35 +23,45 @@ EXECUTION_SPEC = ExecutionSpec(max_retries=5, timeout_seconds=100)
 TIME = 0
 
 
+# Every test execution differs from this template in only a few fields, so create_execution copies it
+EXECUTION_TEMPLATE = ExecutionHeader(
+    project_name=PROJECT_NAME,
+    version_id=VERSION_ID,
+    function_name=FUNCTION_NAME,
+    invocation_id=INVOCATION_NAME,
+    execution_id="exe-template",
+    cancellation_request_time=None,
+    resource_spec=RESOURCE_SPEC,
+    execution_spec=EXECUTION_SPEC,
+    function_status=FunctionStatus.READY,
+    prepared_function_details=None,
+    worker_status=WorkerStatus.RUNNING,
+    worker_details=None,
+    termination_signal_time=None,
+    outcome=None,
+    creation_time=TIME,
+    last_update_time=TIME,
+    execution_start_time=TIME,
+    execution_finish_time=TIME,
+    invocation_creation_time=TIME,
+)
+
+
 def create_execution(
     execution_id: str,
     cancellation_requested: bool = False,
     termination_signal_already_sent: bool = False,
     invocation_creation_time: int = TIME,
-) -> ExecutionInfo:
-    return ExecutionInfo(
-        project_name=PROJECT_NAME,
-        version_id=VERSION_ID,
-        function_name=FUNCTION_NAME,
-        invocation_id=INVOCATION_NAME,
-        execution_id=execution_id,
-        input="input",
-        cancellation_request_time=(TIME if cancellation_requested else None),
-        resource_spec=RESOURCE_SPEC,
-        execution_spec=EXECUTION_SPEC,
-        function_status=FunctionStatus.READY,
-        prepared_function_details=None,
-        worker_status=WorkerStatus.RUNNING,
-        worker_details=None,
-        termination_signal_time=(TIME if termination_signal_already_sent else None),
-        outcome=None,
-        output=None,
-        error_message=None,
-        creation_time=TIME,
-        last_update_time=TIME,
-        execution_start_time=TIME,
-        execution_finish_time=TIME,
-        invocation_creation_time=invocation_creation_time,
+) -> ExecutionHeader:
+    return EXECUTION_TEMPLATE.model_copy(
+        update={
+            "execution_id": execution_id,
+            "cancellation_request_time": (TIME if cancellation_requested else None),
+            "termination_signal_time": (
+                TIME if termination_signal_already_sent else None
+            ),
+            "invocation_creation_time": invocation_creation_time,
+        }
     )
 
 
@@ -60,27 +70,21 @@ def assert_results(
     expected_ids_requiring_termination_signal: Optional[set[str]] = None,
     expected_ids_to_leave_untouched: Optional[set[str]] = None,
 ) -> None:
-    actual_ids_requiring_termination_signal = {
-        execution.execution_id
-        for execution in classification.executions_requiring_termination_signal
-    }
-    actual_ids_to_leave_untouched = {
-        execution.execution_id
-        for execution in classification.executions_to_leave_untouched
-    }
-
     if expected_ids_requiring_termination_signal is None:
-        assert len(actual_ids_requiring_termination_signal) == 0
+        assert len(classification.executions_requiring_termination_signal) == 0
     else:
-        assert (
-            actual_ids_requiring_termination_signal
-            == expected_ids_requiring_termination_signal
-        )
+        assert {
+            execution.execution_id
+            for execution in classification.executions_requiring_termination_signal
+        } == expected_ids_requiring_termination_signal
 
     if expected_ids_to_leave_untouched is None:
-        assert len(actual_ids_to_leave_untouched) == 0
+        assert len(classification.executions_to_leave_untouched) == 0
     else:
-        assert actual_ids_to_leave_untouched == expected_ids_to_leave_untouched
+        assert {
+            execution.execution_id
+            for execution in classification.executions_to_leave_untouched
+        } == expected_ids_to_leave_untouched
 
 
 def test_classify_in_standard_case() -> None:
@@ -37,6 +37,26 @@ PROJECTS = [
 ]
 
 
+# Test invocations differ from this template in only a few fields, so create_invocation copies it
+INVOCATION_TEMPLATE = InvocationInfo(
+    project_name=PROJECT_NAME,
+    version_id=VERSION_ID,
+    function_name=FUNCTION_NAME,
+    invocation_id="inv-template",
+    parent_invocation=None,
+    resource_spec=RESOURCE_SPEC,
+    execution_spec=EXECUTION_SPEC,
+    function_status=FunctionStatus.READY,
+    prepared_function_details=None,
+    input=INPUT,
+    cancellation_request_time=None,
+    invocation_status=InvocationStatus.RUNNING,
+    creation_time=TIME,
+    last_update_time=TIME,
+    executions=[],
+)
+
+
 def create_invocation(
     invocation_id: str,
     parent: Optional[InvocationInfo],
@@ -57,22 +77,16 @@ def create_invocation(
     else:
         parent_invocation_summary = None
 
-    return InvocationInfo(
-        project_name=project_name,
-        version_id=VERSION_ID,
-        function_name=FUNCTION_NAME,
-        invocation_id=invocation_id,
-        parent_invocation=parent_invocation_summary,
-        resource_spec=RESOURCE_SPEC,
-        execution_spec=EXECUTION_SPEC,
-        function_status=FunctionStatus.READY,
-        prepared_function_details=None,
-        input=INPUT,
-        cancellation_request_time=(TIME if cancellation_requested else None),
-        invocation_status=invocation_status,
-        creation_time=creation_time,
-        last_update_time=TIME,
-        executions=[],
+    return INVOCATION_TEMPLATE.model_copy(
+        update={
+            "project_name": project_name,
+            "invocation_id": invocation_id,
+            "parent_invocation": parent_invocation_summary,
+            "cancellation_request_time": (TIME if cancellation_requested else None),
+            "invocation_status": invocation_status,
+            "creation_time": creation_time,
+            "executions": [],
+        }
     )
 
 
@@ -81,27 +95,27 @@ def assert_results(
     expected_ids_to_set_cancellation_requested: Optional[set[str]] = None,
     expected_ids_to_leave_untouched: Optional[set[str]] = None,
 ) -> None:
-    actual_ids_to_set_cancellation_requested = {
-        invocation.invocation_id
-        for invocation in classification.invocations_to_set_cancellation_requested
-    }
-    actual_ids_to_leave_untouched = {
-        invocation.invocation_id
-        for invocation in classification.invocations_to_leave_untouched
-    }
-
     if expected_ids_to_set_cancellation_requested is None:
-        assert len(actual_ids_to_set_cancellation_requested) == 0
+        assert len(classification.invocations_to_set_cancellation_requested) == 0
     else:
-        assert (
-            actual_ids_to_set_cancellation_requested
-            == expected_ids_to_set_cancellation_requested
+        assert len(classification.invocations_to_set_cancellation_requested) == len(
+            expected_ids_to_set_cancellation_requested
         )
+        assert {
+            invocation.invocation_id
+            for invocation in classification.invocations_to_set_cancellation_requested
+        } == expected_ids_to_set_cancellation_requested
 
     if expected_ids_to_leave_untouched is None:
-        assert len(actual_ids_to_leave_untouched) == 0
+        assert len(classification.invocations_to_leave_untouched) == 0
     else:
-        assert actual_ids_to_leave_untouched == expected_ids_to_leave_untouched
+        assert len(classification.invocations_to_leave_untouched) == len(
+            expected_ids_to_leave_untouched
+        )
+        assert {
+            invocation.invocation_id
+            for invocation in classification.invocations_to_leave_untouched
+        } == expected_ids_to_leave_untouched
 
 
 def test_when_parent_is_cancelled_and_has_not_yet_been_cancelled_itself() -> None:
@@ -267,8 +281,41 @@ def test_with_double_propagation_with_some_random_ordering() -> None:
     )
 
     # Put the invocations in the list in the wrong order.
-    # The sorting by creation time in our implementation should ensure the double propagation
-    # happens in a single loop iteration, leading to optimal user experience.
+    # The double propagation should still happen in a single pass, leading to optimal user experience.
+    invocations = [invocation, parent_invocation, grandparent_invocation]
+
+    classification = classify_invocations_for_cancellation_requests(
+        invocations, PROJECTS
+    )
+
+    assert_results(
+        classification,
+        expected_ids_to_set_cancellation_requested={
+            invocation_id,
+            parent_invocation_id,
+        },
+        expected_ids_to_leave_untouched={grandparent_invocation_id},
+    )
+
+
+def test_with_double_propagation_with_equal_creation_times() -> None:
+    grandparent_invocation_id = "grandparent"  # cancelled
+    parent_invocation_id = "parent"  # not yet cancelled
+    invocation_id = "inv"  # not yet cancelled
+
+    grandparent_invocation = create_invocation(
+        grandparent_invocation_id, parent=None, cancellation_requested=True
+    )
+    parent_invocation = create_invocation(
+        parent_invocation_id,
+        parent=grandparent_invocation,
+        cancellation_requested=False,
+    )
+    invocation = create_invocation(
+        invocation_id, parent=parent_invocation, cancellation_requested=False
+    )
+
+    # Creation times are equal, so they give no hint about the order of propagation
     invocations = [invocation, parent_invocation, grandparent_invocation]
 
     classification = classify_invocations_for_cancellation_requests(
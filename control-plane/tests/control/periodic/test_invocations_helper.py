@@ -60,22 +60,51 @@ READY_FUNCTIONS: list[FunctionInfo] = [
 ]
 
 
+# Test executions and invocations differ from these templates in only a few fields,
+# so the helpers below copy them
+EXECUTION_TEMPLATE = ExecutionSummary(
+    execution_id="exe-template",
+    worker_status=WorkerStatus.PENDING,
+    worker_details=None,
+    termination_signal_time=None,
+    outcome=None,
+    output=None,
+    error_message=None,
+    creation_time=TIME,
+    last_update_time=TIME,
+    execution_start_time=None,
+    execution_finish_time=None,
+)
+
+INVOCATION_TEMPLATE = InvocationInfo(
+    project_name=PROJECT_NAME,
+    version_id=VERSION_ID,
+    function_name=FUNCTION_NAME,
+    invocation_id="inv-template",
+    parent_invocation=None,
+    resource_spec=RESOURCE_SPEC,
+    execution_spec=EXECUTION_SPEC,
+    function_status=FunctionStatus.READY,
+    prepared_function_details=None,
+    input="input",
+    cancellation_request_time=None,
+    invocation_status=InvocationStatus.RUNNING,
+    creation_time=TIME,
+    last_update_time=TIME,
+    executions=[],
+)
+
+
 def create_execution(
     worker_status: WorkerStatus, outcome: Optional[ExecutionOutcome]
 ) -> ExecutionSummary:
     # Not all the fields are realistic, but this doesn't matter for the test.
-    return ExecutionSummary(
-        execution_id=generate_random_id("exe"),
-        worker_status=worker_status,
-        worker_details=None,
-        termination_signal_time=None,
-        outcome=outcome,
-        output=None,
-        error_message=None,
-        creation_time=TIME,
-        last_update_time=TIME,
-        execution_start_time=None,
-        execution_finish_time=None,
+    return EXECUTION_TEMPLATE.model_copy(
+        update={
+            "execution_id": generate_random_id("exe"),
+            "worker_status": worker_status,
+            "outcome": outcome,
+        }
     )
 
 
@@ -119,22 +148,16 @@ def create_invocation(
     for _ in range(num_terminated_executions_without_outcome):
         executions.append(create_execution(WorkerStatus.TERMINATED, None))
 
-    return InvocationInfo(
-        project_name=project_name,
-        version_id=VERSION_ID,
-        function_name=function_name,
-        invocation_id=invocation_id,
-        parent_invocation=None,
-        resource_spec=RESOURCE_SPEC,
-        execution_spec=EXECUTION_SPEC,
-        function_status=function_status,
-        prepared_function_details=None,
-        input="input",
-        cancellation_request_time=(TIME if cancellation_requested else None),
-        invocation_status=InvocationStatus.RUNNING,
-        creation_time=creation_time,
-        last_update_time=TIME,
-        executions=executions,
+    return INVOCATION_TEMPLATE.model_copy(
+        update={
+            "project_name": project_name,
+            "function_name": function_name,
+            "invocation_id": invocation_id,
+            "function_status": function_status,
+            "cancellation_request_time": (TIME if cancellation_requested else None),
+            "creation_time": creation_time,
+            "executions": executions,
+        }
     )
 
 
@@ -144,35 +167,38 @@ def assert_results(
     expected_ids_to_create_executions_for: Optional[set[str]] = None,
     expected_ids_to_leave_untouched: Optional[set[str]] = None,
 ) -> None:
-    actual_ids_to_terminate = {
-        invocation.invocation_id
-        for invocation in classification.invocations_to_terminate
-    }
-    actual_ids_to_create_executions_for = {
-        invocation.invocation_id
-        for invocation in classification.invocations_to_create_executions_for
-    }
-    actual_ids_to_leave_untouched = {
-        invocation.invocation_id
-        for invocation in classification.invocations_to_leave_untouched
-    }
-
     if expected_ids_to_terminate is None:
-        assert len(actual_ids_to_terminate) == 0
+        assert len(classification.invocations_to_terminate) == 0
     else:
-        assert actual_ids_to_terminate == expected_ids_to_terminate
+        assert len(classification.invocations_to_terminate) == len(
+            expected_ids_to_terminate
+        )
+        assert {
+            invocation.invocation_id
+            for invocation in classification.invocations_to_terminate
+        } == expected_ids_to_terminate
 
     if expected_ids_to_create_executions_for is None:
-        assert len(actual_ids_to_create_executions_for) == 0
+        assert len(classification.invocations_to_create_executions_for) == 0
     else:
-        assert (
-            actual_ids_to_create_executions_for == expected_ids_to_create_executions_for
+        assert len(classification.invocations_to_create_executions_for) == len(
+            expected_ids_to_create_executions_for
         )
+        assert {
+            invocation.invocation_id
+            for invocation in classification.invocations_to_create_executions_for
+        } == expected_ids_to_create_executions_for
 
     if expected_ids_to_leave_untouched is None:
-        assert len(actual_ids_to_leave_untouched) == 0
+        assert len(classification.invocations_to_leave_untouched) == 0
     else:
-        assert actual_ids_to_leave_untouched == expected_ids_to_leave_untouched
+        assert len(classification.invocations_to_leave_untouched) == len(
+            expected_ids_to_leave_untouched
+        )
+        assert {
+            invocation.invocation_id
+            for invocation in classification.invocations_to_leave_untouched
+        } == expected_ids_to_leave_untouched
 
 
 def test_classify_with_an_existing_running_execution() -> None:
@@ -38,8 +38,9 @@ def conn_pool() -> Iterable[SqlConnectionPool]:
         conn_pool.close()
 
 
-@pytest.fixture()
-def data_store(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
+@pytest.fixture(scope="module")
+def data_store_with_tables(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
+    # Create the tables once per module; the data_store fixture clears them after each test
     data_store = DataStore(conn_pool)
     data_store.create_tables()
     try:
@@ -48,6 +49,15 @@ def data_store(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
         data_store.delete_tables()
 
 
+@pytest.fixture()
+def data_store(data_store_with_tables: DataStore) -> Iterable[DataStore]:
+    data_store = data_store_with_tables
+    try:
+        yield data_store
+    finally:
+        data_store.clear_tables()
+
+
 PROJECT_NAME = "project"
 LATEST_VERSION = VersionReference(
     type=VersionReferenceType.LATEST, named_version_id=None
@@ -669,16 +679,19 @@ def test_invocation_timing_out_while_execution_in_flight(data_store: DataStore)
 
     # But the worker takes a long time to execute.
 
-    # Meanwhile, the clock is ticking. Eventually, the invocation times out, resulting in a termination signal
-    # being sent to the worker.
-    time = TIME
+    # Meanwhile, the clock is ticking. Up to the timeout, no termination signal is sent...
+    loop.run_once(TIME + TIMEOUT_SECONDS)
+    assert not provisioner.worker_has_received_termination_signal(
+        execution.worker_details
+    )
+
+    # ... but once the timeout has elapsed, the invocation times out, resulting in a termination signal
+    # being sent to the worker. Nothing depends on the intermediate ticks, so jump the clock straight there.
+    time = TIME + TIMEOUT_SECONDS + 1
     while not provisioner.worker_has_received_termination_signal(
         execution.worker_details
     ):
         loop.run_once(time)
-        time += 1
-
-    assert time >= TIME + TIMEOUT_SECONDS
 
     # The worker gracefully cleans up and terminates.
     api.execution.set_final_execution_result(
@@ -781,12 +794,12 @@ def test_invocation_timing_out_while_execution_in_flight_and_cleanup_not_finishi
     )
 
     # The invocation times out, resulting in a termination signal being sent to the worker.
-    time = TIME
+    # Nothing depends on the intermediate ticks, so jump the clock straight past the timeout.
+    time = TIME + TIMEOUT_SECONDS + 1
     while not provisioner.worker_has_received_termination_signal(
         execution.worker_details
     ):
         loop.run_once(time)
-        time += 1
 
     # The worker tries to gracefully clean up, but the clean-up itself takes a long time.
     # Before the clean-up finishes, the grace period elapsed, so the worker is forcibly killed.
@@ -979,7 +992,8 @@ def test_invocation_timing_out_before_worker_is_provisioned(
     assert invocation_2.invocation_status == InvocationStatus.RUNNING
 
     # Eventually, the second invocation times out. It goes into TERMINATED status, without an execution being created.
-    time = TIME
+    # Nothing depends on the intermediate ticks, so jump the clock straight past the timeout.
+    time = TIME + TIMEOUT_SECONDS + 1
     while (
         not api.invocation.get_invocation(
             project_name=PROJECT_NAME,
@@ -990,7 +1004,6 @@ def test_invocation_timing_out_before_worker_is_provisioned(
         == InvocationStatus.TERMINATED
     ):
         loop.run_once(time)
-        time += 1
 
     invocation_2 = api.invocation.get_invocation(
         project_name=PROJECT_NAME,
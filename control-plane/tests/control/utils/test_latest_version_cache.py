@@ -0,0 +1,40 @@
+from control_plane.control.api.utils.latest_version_cache import LatestVersionCache
+
+
+def test_get_returns_cached_version_id() -> None:
+    cache = LatestVersionCache()
+    assert cache.get("proj") is None
+
+    cache.put("proj", "ver-1", cache.generation("proj"))
+    assert cache.get("proj") == "ver-1"
+    assert cache.get("other-proj") is None
+
+
+def test_invalidate_drops_entry() -> None:
+    cache = LatestVersionCache()
+    cache.put("proj", "ver-1", cache.generation("proj"))
+
+    cache.invalidate("proj")
+    assert cache.get("proj") is None
+
+
+def test_entries_expire_after_ttl() -> None:
+    cache = LatestVersionCache(ttl_seconds=0)
+    cache.put("proj", "ver-1", cache.generation("proj"))
+
+    assert cache.get("proj") is None
+
+
+def test_put_is_discarded_after_invalidate() -> None:
+    cache = LatestVersionCache()
+
+    # A lookup reads the generation before loading the version id from the database...
+    generation = cache.generation("proj")
+    # ...meanwhile a new version is created, and the cache is invalidated...
+    cache.invalidate("proj")
+    # ...so the version id that the lookup loaded may be out of date, and is not cached.
+    cache.put("proj", "ver-1", generation)
+    assert cache.get("proj") is None
+
+    cache.put("proj", "ver-2", cache.generation("proj"))
+    assert cache.get("proj") == "ver-2"
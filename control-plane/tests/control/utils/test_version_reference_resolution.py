@@ -0,0 +1,169 @@
+from typing import Iterable
+
+import pytest
+
+from control_plane.control.api.registration import RegistrationApiHandler
+from control_plane.control.api.utils.latest_version_cache import LatestVersionCache
+from control_plane.control.api.utils.version_reference_resolution import (
+    resolve_version_reference,
+)
+from control_plane.data.data_store import DataStore
+from control_plane.data.sql_connection import SqlConnectionPool
+from control_plane.types.api_errors import VersionDoesNotExist
+from control_plane.types.datatypes import (
+    ExecutionSpec,
+    FunctionSpec,
+    ResourceSpec,
+    VersionDefinition,
+)
+from control_plane.types.version_reference import (
+    LATEST_VERSION_REFERENCE,
+    VersionReference,
+    VersionReferenceType,
+)
+
+PROJECT_NAME = "project"
+
+VERSION_ID_1 = "version-1"
+VERSION_ID_2 = "version-2"
+
+TIME = 0
+LATER_TIME = 10
+
+VERSION_DEFINITION = VersionDefinition(
+    default_docker_image="image",
+    functions=[
+        FunctionSpec(
+            function_name="function",
+            resource_spec=ResourceSpec(
+                virtual_cpus=1.0, memory_gbs=4.0, max_concurrency=1
+            ),
+            execution_spec=ExecutionSpec(timeout_seconds=60, max_retries=0),
+        ),
+    ],
+)
+
+
+@pytest.fixture(scope="module")
+def conn_pool() -> Iterable[SqlConnectionPool]:
+    conn_pool = SqlConnectionPool.create_for_local_postgres()
+    try:
+        yield conn_pool
+    finally:
+        conn_pool.close()
+
+
+@pytest.fixture(scope="module")
+def data_store_with_tables(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
+    # Create the tables once per module; the data_store fixture clears them after each test
+    data_store = DataStore(conn_pool)
+    data_store.create_tables()
+    try:
+        yield data_store
+    finally:
+        data_store.delete_tables()
+
+
+@pytest.fixture()
+def data_store(data_store_with_tables: DataStore) -> Iterable[DataStore]:
+    data_store = data_store_with_tables
+
+    # Set up each test with the project already inserted.
+    data_store.projects.create(
+        project_name=PROJECT_NAME, deletion_request_time=None, creation_time=TIME
+    )
+
+    try:
+        yield data_store
+
+    finally:
+        data_store.clear_tables()
+
+
+def test_named_version_is_not_cached(data_store: DataStore) -> None:
+    cache = LatestVersionCache()
+    version_ref = VersionReference(
+        type=VersionReferenceType.NAMED, named_version_id=VERSION_ID_1
+    )
+
+    version_id = resolve_version_reference(PROJECT_NAME, version_ref, data_store, cache)
+    assert version_id == VERSION_ID_1
+    assert cache.get(PROJECT_NAME) is None
+
+
+def test_latest_version_is_served_from_cache(data_store: DataStore) -> None:
+    cache = LatestVersionCache()
+    data_store.project_versions.create(
+        project_name=PROJECT_NAME, version_id=VERSION_ID_1, creation_time=TIME
+    )
+
+    version_id = resolve_version_reference(
+        PROJECT_NAME, LATEST_VERSION_REFERENCE, data_store, cache
+    )
+    assert version_id == VERSION_ID_1
+
+    # A version created directly in the data store does not invalidate the cache. So the second resolution
+    # returning the first version shows that it did not query the data store.
+    data_store.project_versions.create(
+        project_name=PROJECT_NAME, version_id=VERSION_ID_2, creation_time=LATER_TIME
+    )
+
+    version_id = resolve_version_reference(
+        PROJECT_NAME, LATEST_VERSION_REFERENCE, data_store, cache
+    )
+    assert version_id == VERSION_ID_1
+
+
+def test_registration_api_invalidates_cache(data_store: DataStore) -> None:
+    cache = LatestVersionCache()
+    registration = RegistrationApiHandler(data_store, cache)
+
+    version_1 = registration.create_project_version(
+        project_name=PROJECT_NAME, version_definition=VERSION_DEFINITION, time=TIME
+    )
+    latest_version = registration.get_project_version(
+        project_name=PROJECT_NAME, version_ref=LATEST_VERSION_REFERENCE
+    )
+    assert latest_version.version_id == version_1.version_id
+    assert cache.get(PROJECT_NAME) == version_1.version_id
+
+    # "latest" resolves to the new version straight after it is created.
+    version_2 = registration.create_project_version(
+        project_name=PROJECT_NAME,
+        version_definition=VERSION_DEFINITION,
+        time=LATER_TIME,
+    )
+    latest_version = registration.get_project_version(
+        project_name=PROJECT_NAME, version_ref=LATEST_VERSION_REFERENCE
+    )
+    assert latest_version.version_id == version_2.version_id
+
+    registration.delete_project(project_name=PROJECT_NAME, time=LATER_TIME)
+    assert cache.get(PROJECT_NAME) is None
+
+
+def test_recreated_project_does_not_resolve_to_old_version(
+    data_store: DataStore,
+) -> None:
+    cache = LatestVersionCache()
+    registration = RegistrationApiHandler(data_store, cache)
+
+    old_version = registration.create_project_version(
+        project_name=PROJECT_NAME, version_definition=VERSION_DEFINITION, time=TIME
+    )
+    registration.delete_project(project_name=PROJECT_NAME, time=TIME)
+
+    # Before the loop deletes the project, a request re-caches its latest version
+    version_id = resolve_version_reference(
+        PROJECT_NAME, LATEST_VERSION_REFERENCE, data_store, cache
+    )
+    assert version_id == old_version.version_id
+
+    data_store.projects.delete_with_cascade(project_name=PROJECT_NAME)
+    registration.create_project(project_name=PROJECT_NAME, time=LATER_TIME)
+
+    # The recreated project has no versions yet
+    with pytest.raises(VersionDoesNotExist):
+        resolve_version_reference(
+            PROJECT_NAME, LATEST_VERSION_REFERENCE, data_store, cache
+        )
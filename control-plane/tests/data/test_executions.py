@@ -85,10 +85,20 @@ TIME = 0
 LATER_TIME = 10
 
 
-@pytest.fixture()
-def data_store(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
+@pytest.fixture(scope="module")
+def data_store_with_tables(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
+    # Create the tables once per module; the data_store fixture clears them after each test
     data_store = DataStore(conn_pool)
     data_store.create_tables()
+    try:
+        yield data_store
+    finally:
+        data_store.delete_tables()
+
+
+@pytest.fixture()
+def data_store(data_store_with_tables: DataStore) -> Iterable[DataStore]:
+    data_store = data_store_with_tables
 
     # Set up each test with the project, version, functions and invocations already inserted.
     # Note that the two invocations are associated with different functions.
@@ -154,7 +164,7 @@ def data_store(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
         yield data_store
 
     finally:
-        data_store.delete_tables()
+        data_store.clear_tables()
 
 
 def test_create_two_executions_for_different_invocations(data_store: DataStore) -> None:
@@ -233,7 +243,6 @@ def test_create_two_executions_for_different_invocations(data_store: DataStore)
     assert all_executions[0].function_name == FUNCTION_NAME_1
     assert all_executions[0].invocation_id == INVOCATION_ID_1
     assert all_executions[0].execution_id == EXECUTION_ID_1
-    assert all_executions[0].input == INPUT_1
     assert all_executions[0].cancellation_requested == False
     assert all_executions[0].resource_spec.virtual_cpus == pytest.approx(
         RESOURCE_SPEC_1.virtual_cpus, 1.0e-5
@@ -245,8 +254,6 @@ def test_create_two_executions_for_different_invocations(data_store: DataStore)
     assert all_executions[0].worker_details is None
     assert all_executions[0].termination_signal_sent == False
     assert all_executions[0].outcome is None
-    assert all_executions[0].output is None
-    assert all_executions[0].error_message is None
     assert all_executions[0].creation_time == TIME
     assert all_executions[0].last_update_time == TIME
     assert all_executions[0].execution_start_time is None
@@ -720,8 +727,6 @@ def test_update_execution_results(data_store: DataStore) -> None:
     assert len(all_executions) == 1
     assert all_executions[0].execution_finish_time == LATER_TIME
     assert all_executions[0].outcome == ExecutionOutcome.FAILED
-    assert all_executions[0].output == OUTPUT_1
-    assert all_executions[0].error_message == ERROR_MESSAGE
 
     invocation = data_store.invocations.get(
         project_name=PROJECT_NAME,
@@ -69,10 +69,20 @@ TIME = 0
 LATER_TIME = 10
 
 
-@pytest.fixture()
-def data_store(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
+@pytest.fixture(scope="module")
+def data_store_with_tables(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
+    # Create the tables once per module; the data_store fixture clears them after each test
     data_store = DataStore(conn_pool)
     data_store.create_tables()
+    try:
+        yield data_store
+    finally:
+        data_store.delete_tables()
+
+
+@pytest.fixture()
+def data_store(data_store_with_tables: DataStore) -> Iterable[DataStore]:
+    data_store = data_store_with_tables
 
     # Set up each test with the project, version and functions already inserted.
     data_store.projects.create(
@@ -108,7 +118,7 @@ def data_store(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
         yield data_store
 
     finally:
-        data_store.delete_tables()
+        data_store.clear_tables()
 
 
 def test_create_two_invocations_for_different_functions(data_store: DataStore) -> None:
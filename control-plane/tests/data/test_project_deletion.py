@@ -51,8 +51,9 @@ WORKER_DETAILS = WorkerDetails(
 TIME = 0
 
 
-@pytest.fixture()
-def data_store(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
+@pytest.fixture(scope="module")
+def data_store_with_tables(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
+    # Create the tables once per module; the data_store fixture clears them after each test
     data_store = DataStore(conn_pool)
     data_store.create_tables()
     try:
@@ -61,6 +62,15 @@ def data_store(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
         data_store.delete_tables()
 
 
+@pytest.fixture()
+def data_store(data_store_with_tables: DataStore) -> Iterable[DataStore]:
+    data_store = data_store_with_tables
+    try:
+        yield data_store
+    finally:
+        data_store.clear_tables()
+
+
 def test_delete_with_cascade(data_store: DataStore) -> None:
     # Create a project with a full set of resources, to check that the cascading deletion works
     data_store.projects.create(
@@ -23,9 +23,9 @@ PROJECT_NAME_2 = "project-2"
 TIME = 0
 
 
-# ... but each test will use fresh data store object.
-@pytest.fixture()
-def data_store(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
+# ... and the same tables...
+@pytest.fixture(scope="module")
+def data_store_with_tables(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
     data_store = DataStore(conn_pool)
     data_store.create_tables()
     try:
@@ -34,6 +34,16 @@ def data_store(conn_pool: SqlConnectionPool) -> Iterable[DataStore]:
         data_store.delete_tables()
 
 
+# ... but each test will start with empty tables.
+@pytest.fixture()
+def data_store(data_store_with_tables: DataStore) -> Iterable[DataStore]:
+    data_store = data_store_with_tables
+    try:
+        yield data_store
+    finally:
+        data_store.clear_tables()
+
+
 def test_create_two_projects(data_store: DataStore) -> None:
     # To begin with, no projects have been created.
     with pytest.raises(ProjectDoesNotExist):
@@ -0,0 +1,120 @@
+from typing import Any
+
+import pytest
+from botocore.exceptions import ClientError
+
+from control_plane.provisioning.ecs_provisioner import (
+    RUN_TASK_MAX_ATTEMPTS,
+    EcsProvisioner,
+    _is_transient_run_task_error,
+)
+
+RUN_TASK_RESPONSE = {"tasks": [{"taskArn": "arn:aws:ecs:task/abc"}], "failures": []}
+
+
+def create_client_error(code: str, message: str = "") -> ClientError:
+    return ClientError(
+        error_response={"Error": {"Code": code, "Message": message}},
+        operation_name="RunTask",
+    )
+
+
+THROTTLING_ERROR = create_client_error("ThrottlingException", "Rate exceeded")
+PROVISIONING_LIMIT_ERROR = create_client_error(
+    "InvalidParameterException",
+    "Tasks provisioning capacity limit exceeded. Too many tasks in PROVISIONING state.",
+)
+OTHER_INVALID_PARAMETER_ERROR = create_client_error(
+    "InvalidParameterException", "No Container Instances were found in your cluster."
+)
+ACCESS_DENIED_ERROR = create_client_error("AccessDeniedException")
+
+
+class StubEcsClient:
+    """
+    Raises the given errors from successive run_task calls, then returns RUN_TASK_RESPONSE.
+    """
+
+    def __init__(self, errors: list[ClientError]) -> None:
+        self._errors = errors
+        self.run_task_calls = 0
+
+    def run_task(self, **kwargs: Any) -> Any:
+        self.run_task_calls += 1
+        if self.run_task_calls <= len(self._errors):
+            raise self._errors[self.run_task_calls - 1]
+        return RUN_TASK_RESPONSE
+
+
+@pytest.fixture
+def sleep_delays(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    delays: list[float] = []
+    monkeypatch.setattr(
+        "control_plane.provisioning.ecs_provisioner.time.sleep", delays.append
+    )
+    return delays
+
+
+def create_provisioner(ecs_client: StubEcsClient) -> EcsProvisioner:
+    provisioner = EcsProvisioner(
+        control_plane_api_url="http://localhost:5000",
+        control_plane_api_key="key",
+        aws_region="eu-west-2",
+        cluster_name="cluster",
+        subnet_ids=["subnet-1"],
+        security_group_ids=["sg-1"],
+        task_role_arn="arn:aws:iam::task-role",
+        execution_role_arn="arn:aws:iam::execution-role",
+        log_group="log-group",
+    )
+    provisioner._ecs_client = ecs_client
+    return provisioner
+
+
+def test_is_transient_run_task_error() -> None:
+    assert _is_transient_run_task_error(THROTTLING_ERROR)
+    assert _is_transient_run_task_error(PROVISIONING_LIMIT_ERROR)
+    assert not _is_transient_run_task_error(OTHER_INVALID_PARAMETER_ERROR)
+    assert not _is_transient_run_task_error(ACCESS_DENIED_ERROR)
+
+
+def test_run_task_succeeds_first_time(sleep_delays: list[float]) -> None:
+    ecs_client = StubEcsClient(errors=[])
+    provisioner = create_provisioner(ecs_client)
+
+    assert provisioner._run_task_with_retries(cluster="cluster") == RUN_TASK_RESPONSE
+    assert ecs_client.run_task_calls == 1
+    assert sleep_delays == []
+
+
+def test_run_task_retries_transient_errors(sleep_delays: list[float]) -> None:
+    ecs_client = StubEcsClient(errors=[THROTTLING_ERROR, PROVISIONING_LIMIT_ERROR])
+    provisioner = create_provisioner(ecs_client)
+
+    assert provisioner._run_task_with_retries(cluster="cluster") == RUN_TASK_RESPONSE
+    assert ecs_client.run_task_calls == 3
+    assert sleep_delays == [1.0, 2.0]
+
+
+def test_run_task_raises_other_errors_immediately(sleep_delays: list[float]) -> None:
+    ecs_client = StubEcsClient(errors=[OTHER_INVALID_PARAMETER_ERROR])
+    provisioner = create_provisioner(ecs_client)
+
+    with pytest.raises(ClientError) as exc_info:
+        provisioner._run_task_with_retries(cluster="cluster")
+
+    assert exc_info.value is OTHER_INVALID_PARAMETER_ERROR
+    assert ecs_client.run_task_calls == 1
+    assert sleep_delays == []
+
+
+def test_run_task_raises_after_max_attempts(sleep_delays: list[float]) -> None:
+    ecs_client = StubEcsClient(errors=[THROTTLING_ERROR] * RUN_TASK_MAX_ATTEMPTS)
+    provisioner = create_provisioner(ecs_client)
+
+    with pytest.raises(ClientError) as exc_info:
+        provisioner._run_task_with_retries(cluster="cluster")
+
+    assert exc_info.value is THROTTLING_ERROR
+    assert ecs_client.run_task_calls == RUN_TASK_MAX_ATTEMPTS
+    assert len(sleep_delays) == RUN_TASK_MAX_ATTEMPTS - 1
@@ -24,42 +24,46 @@ def test_resource_spec_with_negative_cpus() -> None:
     with pytest.raises(ValidationError) as exc_info:
         ResourceSpec(virtual_cpus=-1.0, memory_gbs=4.0, max_concurrency=5)
 
-    assert "virtual_cpus must be positive" in str(exc_info.value)
+    assert "virtual_cpus\n  Input should be greater than 0" in str(exc_info.value)
 
 
 def test_resource_spec_with_cpus_too_high() -> None:
     with pytest.raises(ValidationError) as exc_info:
         ResourceSpec(virtual_cpus=9999.9, memory_gbs=4.0, max_concurrency=5)
 
-    assert "virtual_cpus must not exceed" in str(exc_info.value)
+    assert "virtual_cpus\n  Input should be less than or equal to" in str(
+        exc_info.value
+    )
 
 
 def test_resource_spec_with_negative_memory() -> None:
     with pytest.raises(ValidationError) as exc_info:
         ResourceSpec(virtual_cpus=1.0, memory_gbs=-4.0, max_concurrency=5)
 
-    assert "memory_gbs must be positive" in str(exc_info.value)
+    assert "memory_gbs\n  Input should be greater than 0" in str(exc_info.value)
 
 
 def test_resource_spec_with_memory_too_high() -> None:
     with pytest.raises(ValidationError) as exc_info:
         ResourceSpec(virtual_cpus=1.0, memory_gbs=9999.9, max_concurrency=5)
 
-    assert "memory_gbs must not exceed" in str(exc_info.value)
+    assert "memory_gbs\n  Input should be less than or equal to" in str(exc_info.value)
 
 
 def test_resource_spec_with_negative_max_concurrency() -> None:
     with pytest.raises(ValidationError) as exc_info:
         ResourceSpec(virtual_cpus=1.0, memory_gbs=-4.0, max_concurrency=-5)
 
-    assert "max_concurrency must be positive" in str(exc_info.value)
+    assert "max_concurrency\n  Input should be greater than 0" in str(exc_info.value)
 
 
 def test_resource_spec_with_max_concurrency_too_high() -> None:
     with pytest.raises(ValidationError) as exc_info:
         ResourceSpec(virtual_cpus=1.0, memory_gbs=9999.9, max_concurrency=1000)
 
-    assert "max_concurrency must not exceed" in str(exc_info.value)
+    assert "max_concurrency\n  Input should be less than or equal to" in str(
+        exc_info.value
+    )
 
 
 def test_valid_execution_spec() -> None:
@@ -72,21 +76,25 @@ def test_execution_spec_with_negative_timeout() -> None:
     with pytest.raises(ValidationError) as exc_info:
         ExecutionSpec(timeout_seconds=-600, max_retries=0)
 
-    assert "timeout_seconds must be positive" in str(exc_info.value)
+    assert "timeout_seconds\n  Input should be greater than 0" in str(exc_info.value)
 
 
 def test_execution_spec_with_timeout_too_high() -> None:
     with pytest.raises(ValidationError) as exc_info:
         ExecutionSpec(timeout_seconds=99999999, max_retries=0)
 
-    assert "timeout_seconds must not exceed" in str(exc_info.value)
+    assert "timeout_seconds\n  Input should be less than or equal to" in str(
+        exc_info.value
+    )
 
 
 def test_execution_spec_with_negative_max_retries() -> None:
     with pytest.raises(ValidationError) as exc_info:
         ExecutionSpec(timeout_seconds=600, max_retries=-1)
 
-    assert "max_retries must be non-negative" in str(exc_info.value)
+    assert "max_retries\n  Input should be greater than or equal to 0" in str(
+        exc_info.value
+    )
 
 
 def test_valid_version_definition() -> None:
@@ -1,3 +1,5 @@
+import base64
+
 import pytest
 
 from control_plane.types.api_errors import OffsetIsInvalid
@@ -11,13 +13,25 @@ def test_serialise_then_deserialise() -> None:
     assert offset == reconstructed_offset
 
 
-def test_deserialise_when_missing_comma() -> None:
+def test_deserialise_when_not_base64() -> None:
     offset_string = "abcde"
     with pytest.raises(OffsetIsInvalid):
         ListOffset.deserialise(offset_string)
 
 
-def test_deserialise_when_creation_time_is_not_an_int() -> None:
-    offset_string = "abc,de"
+def test_deserialise_when_too_short_for_creation_time() -> None:
+    offset_string = base64.urlsafe_b64encode(b"abc").decode()
+    with pytest.raises(OffsetIsInvalid):
+        ListOffset.deserialise(offset_string)
+
+
+def test_deserialise_when_id_is_not_utf8() -> None:
+    offset_string = base64.urlsafe_b64encode(bytes(8) + b"\xff").decode()
+    with pytest.raises(OffsetIsInvalid):
+        ListOffset.deserialise(offset_string)
+
+
+def test_deserialise_when_not_ascii() -> None:
+    offset_string = "é"
     with pytest.raises(OffsetIsInvalid):
         ListOffset.deserialise(offset_string)